@@ -7,13 +7,15 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from obsidian_ontology_mcp.config import get_settings
 from obsidian_ontology_mcp.server import OntologyMCPServer
 
 
 def main() -> None:
     """Run MCP server."""
     try:
-        server = OntologyMCPServer()
+        settings = get_settings()
+        server = OntologyMCPServer(settings.vault_path)
         server.run()
     except KeyboardInterrupt:
         print("\nServer stopped by user")
@@ -7,7 +7,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from obsidian_ontology_mcp.config import settings
+from obsidian_ontology_mcp.config import get_settings
 from obsidian_ontology_mcp.extraction.skos_extractor import SKOSExtractor
 from obsidian_ontology_mcp.graph.builder import KnowledgeGraphBuilder
 from obsidian_ontology_mcp.graph.indexer import GraphIndexer
@@ -20,6 +20,8 @@ def main() -> None:
     print("Obsidian Ontology MCP Server - Test Script")
     print("=" * 60)
 
+    settings = get_settings()
+
     # Test 1: Extract concepts
     print(f"\n1. Extracting concepts from: {settings.vault_path}")
     extractor = SKOSExtractor(settings.vault_path)
@@ -39,12 +41,14 @@ def main() -> None:
 
     # Test 3: Build indexes
     print("\n3. Building indexes...")
-    indexer = GraphIndexer(graph)
+    indexer = GraphIndexer(graph, concepts)
     print(f"   ✓ Indexed {len(indexer.label_index)} labels")
 
     # Test 4: Query engine
     print("\n4. Testing query engine...")
-    query_engine = GraphQueryEngine(graph, indexer)
+    query_engine = GraphQueryEngine(
+        graph, indexer, csr=builder.csr, relations=builder.relations
+    )
 
     # Test search
     print("\n   a) Search for 'machine learning':")
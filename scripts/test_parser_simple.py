@@ -5,6 +5,9 @@ import re
 import sys
 from pathlib import Path
 
+WIKILINK_RE = re.compile(r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]')
+SKOS_FIELD_RE = re.compile(r'skos:(\w+):\s*(.+)')
+
 def extract_frontmatter(file_path):
     """Extract YAML frontmatter from markdown file."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -23,7 +26,7 @@ def extract_frontmatter(file_path):
 
 def parse_skos_field(line):
     """Parse a SKOS field line."""
-    match = re.match(r'skos:(\w+):\s*(.+)', line)
+    match = SKOS_FIELD_RE.match(line)
     if match:
         field_name = match.group(1)
         value = match.group(2).strip()
@@ -32,8 +35,7 @@ def parse_skos_field(line):
 
 def extract_wikilinks(text):
     """Extract wikilinks from text."""
-    pattern = r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]'
-    return re.findall(pattern, text)
+    return WIKILINK_RE.findall(text)
 
 def test_vault(vault_path):
     """Test extraction from vault."""
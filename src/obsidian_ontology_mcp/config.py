@@ -1,103 +1,196 @@
-"""Configuration management using Pydantic Settings."""
+"""Configuration management using environment variables."""
 
+import json
+import os
 import secrets
+from dataclasses import MISSING, dataclass, field, fields, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Type, TypeVar, cast
 
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+T = TypeVar("T")
 
+ENV_FILE = Path(".env")
 
-class SecuritySettings(BaseSettings):
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+@dataclass(slots=True, frozen=True)
+class SecuritySettings:
     """Security-related configuration."""
 
     # Authentication
-    enable_authentication: bool = Field(default=True)
-    admin_username: str = Field(default="admin")
-    admin_password_hash: str = Field(
-        default="",
-        description="bcrypt hash of admin password",
-    )
+    enable_authentication: bool = True
+    admin_username: str = "admin"
+    admin_password_hash: str = ""  # bcrypt hash of admin password
 
     # JWT
-    jwt_secret_key: str = Field(
-        default_factory=lambda: secrets.token_urlsafe(32),
-        description="Secret key for JWT token signing",
-    )
-    jwt_algorithm: str = Field(default="HS256")
-    jwt_access_token_expire_minutes: int = Field(default=30)
+    jwt_secret_key: str = field(default_factory=lambda: secrets.token_urlsafe(32))
+    jwt_algorithm: str = "HS256"
+    jwt_access_token_expire_minutes: int = 30
 
     # Rate Limiting
-    rate_limit_enabled: bool = Field(default=True)
-    rate_limit_per_minute: int = Field(default=60)
-    rate_limit_burst: int = Field(default=10)
+    rate_limit_enabled: bool = True
+    rate_limit_per_minute: int = 60
+    rate_limit_burst: int = 10
 
     # Input Validation Limits
-    max_query_length: int = Field(default=1000)
-    max_context_depth: int = Field(default=3)
-    max_results_per_query: int = Field(default=100)
-    max_concept_content_length: int = Field(default=50000)
+    max_query_length: int = 1000
+    max_context_depth: int = 3
+    max_results_per_query: int = 100
+    max_concept_content_length: int = 50000
 
 
-class Settings(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class Settings:
     """Main application settings."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # Vault Configuration
-    vault_path: Path = Field(
-        ...,
-        description="Absolute path to Obsidian vault",
-    )
-    vault_watch_enabled: bool = Field(
-        default=True,
-        description="Enable file system watcher for real-time updates",
-    )
+    vault_path: Path  # Absolute path to Obsidian vault
+    vault_watch_enabled: bool = True
 
     # MCP Server
-    mcp_server_name: str = Field(default="Obsidian Ontology Server")
-    mcp_server_version: str = Field(default="0.2.0")
+    mcp_server_name: str = "Obsidian Ontology Server"
+    mcp_server_version: str = "0.2.0"
 
     # HTTP Server
-    http_host: str = Field(default="127.0.0.1")
-    http_port: int = Field(default=8000)
-    http_enable_cors: bool = Field(default=False)
-    http_allowed_origins: List[str] = Field(default_factory=lambda: ["http://localhost:5678"])
+    http_host: str = "127.0.0.1"
+    http_port: int = 8000
+    http_enable_cors: bool = False
+    http_allowed_origins: List[str] = field(
+        default_factory=lambda: ["http://localhost:5678"]
+    )
 
     # Logging
-    log_level: str = Field(default="INFO")
-    log_file: Path = Field(default=Path("logs/ontology_mcp.log"))
-    audit_log_file: Path = Field(default=Path("logs/audit.log"))
+    log_level: str = "INFO"
+    log_file: Path = Path("logs/ontology_mcp.log")
+    audit_log_file: Path = Path("logs/audit.log")
 
     # Performance
-    graph_cache_enabled: bool = Field(default=True)
-    graph_cache_ttl: int = Field(default=3600)
+    graph_cache_enabled: bool = True
+    graph_cache_ttl: int = 3600
+    cache_dir: Path = Path(".cache")  # On-disk caches (parsed concepts)
+    extraction_workers: int = 0  # Parser processes (0: one per CPU, 1: serial)
 
     # Security Settings
-    security: SecuritySettings = Field(default_factory=SecuritySettings)
-
-    @field_validator("vault_path")
-    @classmethod
-    def validate_vault_path(cls, v: Path) -> Path:
-        """Ensure vault path exists and is a directory."""
-        if not v.exists():
-            raise ValueError(f"Vault path does not exist: {v}")
-        if not v.is_dir():
-            raise ValueError(f"Vault path is not a directory: {v}")
-        return v.resolve()
-
-    @field_validator("log_file", "audit_log_file")
-    @classmethod
-    def ensure_log_directory(cls, v: Path) -> Path:
-        """Create log directory if it doesn't exist."""
-        v.parent.mkdir(parents=True, exist_ok=True)
-        return v
-
-
-# Global settings instance
-settings = Settings()
+    security: SecuritySettings = field(default_factory=SecuritySettings)
+
+
+def _parse_value(name: str, raw: str, type_: Any) -> Any:
+    """
+    Convert an environment variable string to a field type.
+
+    Args:
+        name: Environment variable name (for error messages)
+        raw: Raw string value
+        type_: Target field type
+
+    Returns:
+        Converted value
+
+    Raises:
+        ValueError: If the value cannot be converted
+    """
+    if type_ is bool:
+        value = raw.strip().lower()
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+        raise ValueError(f"{name}: invalid boolean {raw!r}")
+    if type_ is int:
+        try:
+            return int(raw)
+        except ValueError:
+            raise ValueError(f"{name}: invalid integer {raw!r}") from None
+    if type_ is Path:
+        return Path(raw)
+    if type_ == List[str]:
+        # JSON arrays (as accepted by pydantic-settings) or comma-separated
+        if raw.lstrip().startswith("["):
+            return [str(item) for item in json.loads(raw)]
+        return [item.strip() for item in raw.split(",") if item.strip()]
+    return raw
+
+
+def _from_env(cls: Type[T]) -> T:
+    """
+    Build a settings dataclass from environment variables.
+
+    Each field is read from the upper-cased field name; nested settings
+    dataclasses read their own fields the same way.
+
+    Args:
+        cls: Settings dataclass
+
+    Returns:
+        Settings instance
+
+    Raises:
+        ValueError: If a value is invalid or a required variable is missing
+    """
+    values: Dict[str, Any] = {}
+    for f in fields(cls):  # type: ignore[arg-type]
+        if f.type is SecuritySettings:
+            values[f.name] = _from_env(SecuritySettings)
+            continue
+        env_name = f.name.upper()
+        raw = os.environ.get(env_name)
+        if raw is not None:
+            values[f.name] = _parse_value(env_name, raw, f.type)
+        elif f.default is MISSING and f.default_factory is MISSING:
+            raise ValueError(f"Missing required environment variable {env_name}")
+    return cls(**values)
+
+
+def _validate_vault_path(v: Path) -> Path:
+    """Ensure vault path exists and is a directory."""
+    if not v.exists():
+        raise ValueError(f"Vault path does not exist: {v}")
+    if not v.is_dir():
+        raise ValueError(f"Vault path is not a directory: {v}")
+    return v.resolve()
+
+
+def _load_settings() -> Settings:
+    """
+    Load and validate settings from the environment and .env file.
+
+    Returns:
+        Validated Settings instance
+    """
+    if ENV_FILE.is_file():
+        from dotenv import load_dotenv
+
+        # Real environment variables take precedence over .env
+        load_dotenv(ENV_FILE, encoding="utf-8", override=False)
+
+    settings = _from_env(Settings)
+
+    # Create log directories if they don't exist
+    for log_file in (settings.log_file, settings.audit_log_file):
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    return replace(settings, vault_path=_validate_vault_path(settings.vault_path))
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+
+    Set USE_PYDANTIC_SETTINGS=1 to use the legacy Pydantic implementation,
+    which exposes the same attribute names.
+
+    Returns:
+        Settings instance (shared across calls)
+    """
+    if os.environ.get("USE_PYDANTIC_SETTINGS") == "1":
+        from .config_pydantic import Settings as PydanticSettings
+
+        # Required fields such as vault_path are read from the environment,
+        # which the constructor signature cannot show
+        settings_cls: Type[Any] = PydanticSettings
+        return cast(Settings, settings_cls())
+    return _load_settings()
@@ -1,56 +1,285 @@
 """Frontmatter parser for extracting SKOS and Schema.org metadata."""
 
+import asyncio
 import logging
+import mmap
+import os
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Union
 
-import frontmatter
-from pydantic import BaseModel, Field
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are memory-mapped instead of read in full
+MMAP_THRESHOLD = 4096
+
+Buffer = Union[bytes, mmap.mmap]
+_WHITESPACE = frozenset(b" \t\r\n\x0b\x0c")
+
+# Frontmatter delimiter lines: "---" plus optional trailing space or "\r"
+_DASH = ord("-")
+_NEWLINE = ord("\n")
+_LINE_SPACE = frozenset(b" \t\r")
+
+# Wikilinks: [[Note Title]] or [[Note Title|Alias]]
+_WIKILINK_RE = re.compile(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]")
+
+# Frontmatter fields holding lists (wikilinks or comma-separated values)
+_LIST_FIELDS = frozenset(
+    {
+        "altLabel",
+        "aliases",
+        "broader",
+        "narrower",
+        "related",
+        "about",
+        "teaches",
+        "course",
+        "prerequisite",
+        "tags",
+    }
+)
+
+# Frontmatter key -> ConceptMetadata attribute, applied in order
+# (so @type wins over type when a note has both)
+_ALIAS_MAP: Tuple[Tuple[str, str], ...] = (
+    ("prefLabel", "pref_label"),
+    ("altLabel", "alt_label"),
+    ("inScheme", "in_scheme"),
+    ("type", "schema_type"),
+    ("@type", "schema_type"),
+    ("dateCreated", "date_created"),
+    ("educationalLevel", "educational_level"),
+    ("learningResourceType", "learning_resource_type"),
+    ("lectureWeek", "lecture_week"),
+)
+
+
+def _coerce_list(value: Any) -> List[str]:
+    """
+    Normalize a list field that may contain wikilinks or comma-separated values.
+
+    Args:
+        value: Raw frontmatter value
+
+    Returns:
+        List of extracted values
+    """
+    if type(value) is list:
+        # List items may contain wikilinks in strings
+        items: List[str] = []
+        for item in value:
+            if type(item) is str:
+                links = _WIKILINK_RE.findall(item)
+                if links:
+                    items.extend([link.strip() for link in links])
+                else:
+                    items.append(item)
+            else:
+                items.append(str(item))
+        return items
+
+    if type(value) is str:
+        links = _WIKILINK_RE.findall(value)
+        if links:
+            return [link.strip() for link in links]
+        # Fallback: comma-separated values
+        return [item.strip() for item in value.split(",") if item.strip()]
 
-class ConceptMetadata(BaseModel):
-    """Pydantic model for concept metadata from frontmatter."""
+    return [] if value is None else [value]
+
+
+def _delimiter_line_end(buf: Buffer, pos: int) -> int:
+    """
+    Check for a frontmatter delimiter line starting at pos.
+
+    A delimiter line is three or more dashes followed only by spaces, tabs
+    or a carriage return (so CRLF files and trailing spaces are accepted).
+
+    Args:
+        buf: File contents (bytes or mmap)
+        pos: Offset of the start of the line
+
+    Returns:
+        Offset of the terminating newline (or len(buf) at end of file),
+        or -1 if the line is not a delimiter
+    """
+    size = len(buf)
+    i = pos
+    while i < size and buf[i] == _DASH:
+        i += 1
+    if i - pos < 3:
+        return -1
+    while i < size and buf[i] in _LINE_SPACE:
+        i += 1
+    if i < size and buf[i] != _NEWLINE:
+        return -1
+    return i
+
+
+def _load_yaml(data: bytes) -> Any:
+    """
+    Parse a single YAML document.
+
+    Equivalent to yaml.load(data, Loader=YAMLLoader) without the wrapper.
+    A loader binds its input stream when it is created, so one is built per
+    document and disposed straight away to free the libyaml parser state.
+
+    Args:
+        data: YAML source
+
+    Returns:
+        Parsed document
+    """
+    loader = YAMLLoader(data)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def read_body(file_path: Optional[Path], body_offset: int) -> str:
+    """
+    Read a note body from disk.
+
+    Args:
+        file_path: Path to markdown file
+        body_offset: Byte offset where the body starts
+
+    Returns:
+        Stripped note body, or an empty string if the file cannot be read
+    """
+    if file_path is None:
+        return ""
+    try:
+        with open(file_path, "rb") as f:
+            f.seek(body_offset)
+            return f.read().decode("utf-8").strip()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Could not read body of {file_path}: {e}")
+        return ""
+
+
+@dataclass(slots=True)
+class ConceptMetadata:
+    """Concept metadata from frontmatter."""
 
     # SKOS Core Properties (supports both skos:prefLabel and prefLabel formats)
-    pref_label: str = Field(..., alias="prefLabel")
-    alt_label: List[str] = Field(default_factory=list, alias="altLabel")
+    pref_label: str
+    alt_label: List[str] = field(default_factory=list)
     definition: Optional[str] = None
     notation: Optional[str] = None
-    in_scheme: Optional[str] = Field(default=None, alias="inScheme")
+    in_scheme: Optional[str] = None
 
     # SKOS Relations (wikilinks)
-    broader: List[str] = Field(default_factory=list)
-    narrower: List[str] = Field(default_factory=list)
-    related: List[str] = Field(default_factory=list)
+    broader: List[str] = field(default_factory=list)
+    narrower: List[str] = field(default_factory=list)
+    related: List[str] = field(default_factory=list)
 
     # Schema.org Properties
-    schema_type: Optional[str] = Field(default=None, alias="type")
+    schema_type: Optional[str] = None
     identifier: Optional[str] = None
-    date_created: Optional[str] = Field(default=None, alias="dateCreated")
-    about: List[str] = Field(default_factory=list)
-    teaches: List[str] = Field(default_factory=list)
-    educational_level: Optional[str] = Field(default=None, alias="educationalLevel")
-    learning_resource_type: Optional[str] = Field(
-        default=None, alias="learningResourceType"
-    )
+    date_created: Optional[str] = None
+    about: List[str] = field(default_factory=list)
+    teaches: List[str] = field(default_factory=list)
+    educational_level: Optional[str] = None
+    learning_resource_type: Optional[str] = None
 
     # Additional Metadata
-    aliases: List[str] = Field(default_factory=list)
-    tags: List[str] = Field(default_factory=list)
-    course: List[str] = Field(default_factory=list)
-    lecture_week: Optional[int] = Field(default=None, alias="lectureWeek")
-    prerequisite: List[str] = Field(default_factory=list)
+    aliases: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    course: List[str] = field(default_factory=list)
+    lecture_week: Optional[int] = None
+    prerequisite: List[str] = field(default_factory=list)
 
     # File Metadata
     file_path: Optional[Path] = None
-    content: Optional[str] = None
+    body_offset: int = 0
+
+    _STR_ATTRS: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "pref_label",
+            "definition",
+            "notation",
+            "in_scheme",
+            "schema_type",
+            "identifier",
+            "date_created",
+            "educational_level",
+            "learning_resource_type",
+        }
+    )
+    _LIST_ATTRS: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "alt_label",
+            "broader",
+            "narrower",
+            "related",
+            "about",
+            "teaches",
+            "aliases",
+            "tags",
+            "course",
+            "prerequisite",
+        }
+    )
+
+    _FIELDS: ClassVar[FrozenSet[str]] = _STR_ATTRS | _LIST_ATTRS | {"lecture_week"}
 
-    class Config:
-        """Pydantic config."""
+    @property
+    def content(self) -> str:
+        """Note body, read from disk on access."""
+        return read_body(self.file_path, self.body_offset)
 
-        populate_by_name = True
+    @classmethod
+    def from_raw(
+        cls, raw: Dict[str, Any], file_path: Path, body_offset: int
+    ) -> "ConceptMetadata":
+        """
+        Build metadata from a normalized frontmatter dictionary.
+
+        Args:
+            raw: Frontmatter dictionary (SKOS prefixes already stripped);
+                aliased keys are renamed in place
+            file_path: Path to the markdown file
+            body_offset: Byte offset where the note body starts
+
+        Returns:
+            ConceptMetadata object
+
+        Raises:
+            ValueError: If prefLabel is missing or a field has an invalid value
+        """
+        for src, dst in _ALIAS_MAP:
+            if src in raw:
+                raw[dst] = raw.pop(src)
+
+        values: Dict[str, Any] = {}
+        for name in cls._FIELDS & raw.keys():
+            value = raw[name]
+            if name in cls._LIST_ATTRS:
+                if not isinstance(value, list):
+                    value = [value]
+                # e.g. "broader: 42" would otherwise fail later, when the
+                # links are resolved to concept IDs
+                if not all(isinstance(item, str) for item in value):
+                    raise ValueError(f"{name} must be a list of strings")
+                values[name] = value
+            elif name == "lecture_week":
+                values[name] = None if value is None else int(value)
+            else:
+                values[name] = None if value is None else str(value)
+
+        if values.get("pref_label") is None:
+            raise ValueError("prefLabel is required")
+
+        return cls(file_path=file_path, body_offset=body_offset, **values)
 
 
 class FrontmatterParser:
@@ -64,6 +293,8 @@ class FrontmatterParser:
         """
         Parse a markdown file and extract concept metadata.
 
+        The note body is not read; ConceptMetadata.content loads it on access.
+
         Args:
             file_path: Path to markdown file
 
@@ -71,99 +302,136 @@ class FrontmatterParser:
             ConceptMetadata object or None if parsing fails
         """
         try:
-            # Parse frontmatter
-            with open(file_path, "r", encoding="utf-8") as f:
-                post = frontmatter.load(f)
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                    return self._parse_buffer(f.read(), file_path)
+                # Large notes: only the pages holding the frontmatter are read
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._parse_buffer(mm, file_path)
 
-            # Normalize SKOS namespace (skos:prefLabel -> prefLabel)
-            metadata_dict = self._normalize_skos_keys(dict(post.metadata))
+        except Exception as e:
+            self.logger.error(f"Error parsing {file_path}: {e}")
+            return None
 
-            # Check if this is a concept (must have prefLabel or skos:prefLabel)
-            if "prefLabel" not in metadata_dict:
-                self.logger.debug(f"Skipping {file_path.name}: no prefLabel")
-                return None
+    async def parse_file_async(self, file_path: Path) -> Optional[ConceptMetadata]:
+        """
+        Parse a markdown file, reading it in a worker thread.
 
-            # Normalize list fields
-            for field in ["altLabel", "aliases", "broader", "narrower", "related", "about", "teaches", "course", "prerequisite", "tags"]:
-                if field in metadata_dict:
-                    value = metadata_dict[field]
-                    if isinstance(value, str):
-                        # Parse wikilinks or comma-separated values
-                        metadata_dict[field] = self._parse_list_field(value)
-                    elif isinstance(value, list):
-                        # Process list items (may contain wikilinks in strings)
-                        processed = []
-                        for item in value:
-                            if isinstance(item, str):
-                                # Extract wikilinks from string items
-                                links = self.extract_wikilinks(item)
-                                if links:
-                                    processed.extend(links)
-                                else:
-                                    processed.append(item)
-                            else:
-                                processed.append(str(item))
-                        metadata_dict[field] = processed
-                    elif value is not None:
-                        metadata_dict[field] = [value]
-
-            # Normalize Schema.org @type
-            if "@type" in metadata_dict:
-                metadata_dict["type"] = metadata_dict.pop("@type")
-
-            # Add file metadata
-            metadata_dict["file_path"] = file_path
-            metadata_dict["content"] = post.content
-
-            # Create and validate model
-            concept = ConceptMetadata(**metadata_dict)
-            return concept
+        Only the read is offloaded; parsing runs on the event loop, so many
+        concurrent calls overlap their I/O latency.
+
+        Args:
+            file_path: Path to markdown file
+
+        Returns:
+            ConceptMetadata object or None if parsing fails
+        """
+        try:
+            data = await asyncio.to_thread(file_path.read_bytes)
+            return self._parse_buffer(data, file_path)
 
         except Exception as e:
             self.logger.error(f"Error parsing {file_path}: {e}")
             return None
 
-    def _normalize_skos_keys(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_buffer(
+        self, buf: Buffer, file_path: Path
+    ) -> Optional[ConceptMetadata]:
         """
-        Normalize SKOS namespace keys (skos:prefLabel -> prefLabel).
+        Parse concept metadata from raw file contents.
 
         Args:
-            metadata: Raw metadata dictionary
+            buf: File contents (bytes or mmap)
+            file_path: Path to markdown file
 
         Returns:
-            Normalized metadata dictionary
+            ConceptMetadata object or None if the file is not a concept
         """
-        normalized = {}
-        for key, value in metadata.items():
-            # Remove skos: prefix
-            if key.startswith("skos:"):
-                normalized_key = key[5:]  # Remove "skos:"
-                normalized[normalized_key] = value
-            else:
-                normalized[key] = value
-        return normalized
+        # Split frontmatter from body and parse only the YAML block
+        split = self._split_frontmatter(buf)
+        if split is None:
+            self.logger.debug(f"Skipping {file_path.name}: no frontmatter")
+            return None
+        meta_start, meta_end, body_start = split
 
-    def _parse_list_field(self, value: str) -> List[str]:
+        metadata = _load_yaml(buf[meta_start:meta_end])
+        if not isinstance(metadata, dict):
+            self.logger.debug(f"Skipping {file_path.name}: no prefLabel")
+            return None
+
+        # Normalize SKOS namespace (skos:prefLabel -> prefLabel)
+        metadata_dict = self._normalize_skos_keys(metadata)
+
+        # Check if this is a concept (must have prefLabel or skos:prefLabel)
+        if "prefLabel" not in metadata_dict:
+            self.logger.debug(f"Skipping {file_path.name}: no prefLabel")
+            return None
+
+        # Normalize list fields
+        for field_name in _LIST_FIELDS & metadata_dict.keys():
+            metadata_dict[field_name] = _coerce_list(metadata_dict[field_name])
+
+        # Create metadata (resolves aliases such as @type -> schema_type)
+        return ConceptMetadata.from_raw(metadata_dict, file_path, body_start)
+
+    @staticmethod
+    def _split_frontmatter(buf: Buffer) -> Optional[Tuple[int, int, int]]:
         """
-        Parse a list field that may contain wikilinks or comma-separated values.
+        Locate the YAML frontmatter block and the body in raw file contents.
 
         Args:
-            value: String value to parse
+            buf: File contents (bytes or mmap)
 
         Returns:
-            List of extracted values
+            Tuple of (frontmatter start, frontmatter end, body start) offsets
+            or None if there is no frontmatter
+        """
+        # Skip leading whitespace
+        size = len(buf)
+        pos = 0
+        while pos < size and buf[pos] in _WHITESPACE:
+            pos += 1
+
+        line_end = _delimiter_line_end(buf, pos)
+        if line_end == -1 or line_end == size:
+            return None
+
+        # Frontmatter starts on the line after the opening delimiter
+        start = line_end + 1
+
+        # Closing delimiter: the next line that is a delimiter line, not
+        # just any line starting with "---"
+        end = start - 1
+        while True:
+            end = buf.find(b"\n---", end)
+            if end == -1:
+                return None
+            line_end = _delimiter_line_end(buf, end + 1)
+            if line_end != -1:
+                break
+            end += 4
+
+        # Body starts on the line after the closing delimiter
+        return start, max(end, start), size if line_end == size else line_end + 1
+
+    def _normalize_skos_keys(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
-        import re
+        Normalize SKOS namespace keys (skos:prefLabel -> prefLabel).
 
-        # Extract wikilinks: [[Note Title]] or [[Note Title|Alias]]
-        wikilink_pattern = r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]"
-        wikilinks = re.findall(wikilink_pattern, value)
+        Args:
+            metadata: Raw metadata dictionary
 
-        if wikilinks:
-            return [link.strip() for link in wikilinks]
+        Returns:
+            Normalized metadata dictionary (the input itself if no key is prefixed)
+        """
+        if not any(key.startswith("skos:") for key in metadata):
+            return metadata
 
-        # Fallback: comma-separated values
-        return [item.strip() for item in value.split(",") if item.strip()]
+        # Remove skos: prefix
+        return {
+            (key[5:] if key.startswith("skos:") else key): value
+            for key, value in metadata.items()
+        }
 
     def extract_wikilinks(self, text: str) -> List[str]:
         """
@@ -175,7 +443,4 @@ class FrontmatterParser:
         Returns:
             List of linked note titles
         """
-        import re
-
-        pattern = r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]"
-        return [match.strip() for match in re.findall(pattern, text)]
+        return [match.strip() for match in _WIKILINK_RE.findall(text)]
@@ -1,27 +1,44 @@
 """Schema.org mapping utilities for SKOS concepts."""
 
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+# Schema.org type mappings
+TYPE_MAPPINGS = {
+    "EducationalMaterial": "https://schema.org/LearningResource",
+    "Course": "https://schema.org/Course",
+    "Article": "https://schema.org/Article",
+    "Book": "https://schema.org/Book",
+}
+
+# Educational level mappings
+EDUCATIONAL_LEVELS = {
+    "beginner": "https://schema.org/BeginnerLevel",
+    "intermediate": "https://schema.org/IntermediateLevel",
+    "advanced": "https://schema.org/AdvancedLevel",
+    "graduate": "https://schema.org/GraduateLevel",
+    "undergraduate": "https://schema.org/UndergraduateLevel",
+}
+
+
+# The mappings are constant, so results are cached per distinct value
+@lru_cache(maxsize=128)
+def _map_type(schema_type: str) -> str:
+    """Resolve a non-empty schema type to its Schema.org URI."""
+    return TYPE_MAPPINGS.get(schema_type, f"https://schema.org/{schema_type}")
+
+
+@lru_cache(maxsize=128)
+def _map_educational_level(level: str) -> str:
+    """Resolve a non-empty educational level to its Schema.org URI."""
+    return EDUCATIONAL_LEVELS.get(level.lower(), level)
+
 
 class SchemaMapper:
     """Maps SKOS concepts to Schema.org types and properties."""
 
-    # Schema.org type mappings
-    TYPE_MAPPINGS = {
-        "EducationalMaterial": "https://schema.org/LearningResource",
-        "Course": "https://schema.org/Course",
-        "Article": "https://schema.org/Article",
-        "Book": "https://schema.org/Book",
-    }
-
-    # Educational level mappings
-    EDUCATIONAL_LEVELS = {
-        "beginner": "https://schema.org/BeginnerLevel",
-        "intermediate": "https://schema.org/IntermediateLevel",
-        "advanced": "https://schema.org/AdvancedLevel",
-        "graduate": "https://schema.org/GraduateLevel",
-        "undergraduate": "https://schema.org/UndergraduateLevel",
-    }
+    TYPE_MAPPINGS = TYPE_MAPPINGS
+    EDUCATIONAL_LEVELS = EDUCATIONAL_LEVELS
 
     @classmethod
     def map_type(cls, schema_type: Optional[str]) -> Optional[str]:
@@ -36,7 +53,7 @@ class SchemaMapper:
         """
         if not schema_type:
             return None
-        return cls.TYPE_MAPPINGS.get(schema_type, f"https://schema.org/{schema_type}")
+        return _map_type(schema_type)
 
     @classmethod
     def map_educational_level(cls, level: Optional[str]) -> Optional[str]:
@@ -51,7 +68,7 @@ class SchemaMapper:
         """
         if not level:
             return None
-        return cls.EDUCATIONAL_LEVELS.get(level.lower(), level)
+        return _map_educational_level(level)
 
     @classmethod
     def enrich_concept_with_schema(cls, concept_dict: Dict) -> Dict:
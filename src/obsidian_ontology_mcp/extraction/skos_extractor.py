@@ -1,16 +1,135 @@
 """SKOS concept extractor for Obsidian vaults."""
 
+import asyncio
+import hashlib
 import logging
-from dataclasses import dataclass, field
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Optional
+from sys import intern
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .parser import ConceptMetadata, FrontmatterParser
+import orjson
+
+from ..log_queue import ReplayHandler
+from .parser import ConceptMetadata, FrontmatterParser, read_body
 
 logger = logging.getLogger(__name__)
 
+# Below this many files the process pool startup cost outweighs the speedup
+PARALLEL_THRESHOLD = 32
+
+# Maximum concurrent reads (open file descriptors) for async extraction
+ASYNC_READ_LIMIT = 256
+
+# Bump when the cached SKOSConcept layout changes
+CACHE_VERSION = 4
+CACHE_FILE_NAME = "skos_cache.json"
+
+# Concept ID normalization: spaces and hyphens become underscores
+_ID_TRANS = str.maketrans(" -", "__")
+
+# File path -> (mtime_ns, size), in walk order
+Signatures = Dict[str, Tuple[int, int]]
+
+# Per-worker extractor, created by the pool initializer in each process
+_worker_extractor: Optional["SKOSExtractor"] = None
+
+
+def _norm_many(links: List[str], tr: Dict[int, int] = _ID_TRANS) -> List[str]:
+    """
+    Convert wikilink titles to interned concept IDs.
+
+    Args:
+        links: Note titles from wikilinks
+        tr: Translation table (bound as a default for fast local lookup)
+
+    Returns:
+        List of concept IDs
+    """
+    return [intern(link.lower().translate(tr)) for link in links]
+
+
+def _intern_ids(concept: "SKOSConcept") -> None:
+    """
+    Re-intern the concept IDs of a concept in place.
+
+    Interning does not survive pickling, so concepts coming back from pool
+    workers or the on-disk cache are passed through here.
+
+    Args:
+        concept: Concept to update
+    """
+    concept.concept_id = intern(concept.concept_id)
+    for links in (
+        concept.broader,
+        concept.narrower,
+        concept.related,
+        concept.prerequisite,
+    ):
+        links[:] = [intern(link) for link in links]
+
+
+def _walk_md(root: str) -> Iterator[str]:
+    """
+    Recursively yield markdown file paths, pruning hidden entries.
+
+    Hidden directories (.obsidian, .git, .trash, ...) are never descended.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Paths of non-hidden markdown files
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield entry.path
 
-@dataclass
+
+def _init_worker(vault_path: Path, log_queue: Any, log_level: int) -> None:
+    """
+    Create the extractor used by a pool worker.
+
+    Args:
+        vault_path: Path to Obsidian vault
+        log_queue: Multiprocessing queue replayed by the parent's loggers
+        log_level: Root log level of the parent
+    """
+    global _worker_extractor
+    # Spawned workers start without logging configured; parse errors are
+    # sent to the parent, which writes them to its own handlers
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(log_level)
+    _worker_extractor = SKOSExtractor(vault_path)
+
+
+def _extract_one(file_path: Path) -> Optional["SKOSConcept"]:
+    """
+    Extract a single concept inside a pool worker.
+
+    Args:
+        file_path: Path to markdown file
+
+    Returns:
+        SKOSConcept or None if not a valid concept
+    """
+    assert _worker_extractor is not None
+    return _worker_extractor._parse_concept(file_path)
+
+
+@dataclass(slots=True)
 class SKOSConcept:
     """Represents a SKOS concept extracted from an Obsidian note."""
 
@@ -41,11 +160,31 @@ class SKOSConcept:
 
     # File metadata
     file_path: Path = field(default_factory=Path)
-    content: str = ""
+    body_offset: int = 0
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for graph storage."""
-        return {
+    # Note body once read (not stored in the parse cache)
+    _content: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def content(self) -> str:
+        """Note body, read from disk on first access and kept afterwards."""
+        if self._content is None:
+            self._content = read_body(self.file_path, self.body_offset)
+        return self._content
+
+    def to_dict(self, with_relations: bool = True) -> Dict:
+        """
+        Convert to dictionary for graph storage.
+
+        Args:
+            with_relations: Include the broader, narrower and related lists
+
+        Returns:
+            Concept data dictionary
+        """
+        data: Dict[str, Any] = {
             "concept_id": self.concept_id,
             "uri": self.uri,
             "prefLabel": self.pref_label,
@@ -53,40 +192,91 @@ class SKOSConcept:
             "definition": self.definition,
             "notation": self.notation,
             "inScheme": self.in_scheme,
-            "broader": self.broader,
-            "narrower": self.narrower,
-            "related": self.related,
-            "schema": {
-                "type": self.schema_type,
-                "about": self.about,
-                "teaches": self.teaches,
-                "educationalLevel": self.educational_level,
-                "learningResourceType": self.learning_resource_type,
-            },
-            "academic": {
-                "course": self.course,
-                "lectureWeek": self.lecture_week,
-                "prerequisite": self.prerequisite,
-            },
-            "file_path": str(self.file_path),
-            "content": self.content,
         }
+        if with_relations:
+            data["broader"] = self.broader
+            data["narrower"] = self.narrower
+            data["related"] = self.related
+        data["schema"] = {
+            "type": self.schema_type,
+            "about": self.about,
+            "teaches": self.teaches,
+            "educationalLevel": self.educational_level,
+            "learningResourceType": self.learning_resource_type,
+        }
+        data["academic"] = {
+            "course": self.course,
+            "lectureWeek": self.lecture_week,
+            "prerequisite": self.prerequisite,
+        }
+        data["file_path"] = str(self.file_path)
+        data["content"] = self.content
+        return data
+
+
+# Cache rows store SKOSConcept fields positionally, in declaration order
+_ROW_FIELDS = tuple(f.name for f in fields(SKOSConcept) if f.init)
+_FILE_PATH_COLUMN = _ROW_FIELDS.index("file_path")
+
+
+def _concept_to_row(concept: SKOSConcept) -> List[Any]:
+    """
+    Flatten a concept into a JSON-serializable cache row.
+
+    Args:
+        concept: Concept to serialize
+
+    Returns:
+        Field values in declaration order
+    """
+    row = [getattr(concept, name) for name in _ROW_FIELDS]
+    row[_FILE_PATH_COLUMN] = str(row[_FILE_PATH_COLUMN])
+    return row
+
+
+def _concept_from_row(row: List[Any]) -> SKOSConcept:
+    """
+    Rebuild a concept from a cache row.
+
+    Args:
+        row: Field values in declaration order
+
+    Returns:
+        SKOSConcept object
+    """
+    row[_FILE_PATH_COLUMN] = Path(row[_FILE_PATH_COLUMN])
+    return SKOSConcept(*row)
 
 
 class SKOSExtractor:
     """Extracts SKOS concepts from an Obsidian vault."""
 
-    def __init__(self, vault_path: Path):
+    def __init__(
+        self,
+        vault_path: Path,
+        cache_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+    ):
         """
         Initialize extractor.
 
         Args:
             vault_path: Path to Obsidian vault
+            cache_dir: Directory for the parse cache (disabled if None)
+            max_workers: Parser processes for large scans (None: one per CPU,
+                1: always parse in this process)
         """
         self.vault_path = vault_path
+        self.max_workers = max_workers or os.cpu_count() or 1
         self.parser = FrontmatterParser()
         self.logger = logging.getLogger(__name__)
 
+        # file path -> (mtime_ns, size, concept or None for non-concept files)
+        self.cache_file = cache_dir / CACHE_FILE_NAME if cache_dir else None
+        self._cache: Dict[str, Tuple[int, int, Optional[SKOSConcept]]] = (
+            self._load_cache()
+        )
+
     def extract_all_concepts(self) -> List[SKOSConcept]:
         """
         Extract all SKOS concepts from the vault.
@@ -94,19 +284,234 @@ class SKOSExtractor:
         Returns:
             List of SKOSConcept objects
         """
-        concepts = []
-        markdown_files = list(self.vault_path.rglob("*.md"))
+        return list(self.iter_concepts())
+
+    def iter_concepts(
+        self, signatures: Optional[Signatures] = None
+    ) -> Iterator[SKOSConcept]:
+        """
+        Extract SKOS concepts from the vault one at a time, in walk order.
 
-        self.logger.info(f"Scanning {len(markdown_files)} markdown files in vault")
+        Cached concepts are yielded while pool workers are still parsing
+        changed files. The parse cache is saved once the iterator has been
+        exhausted.
 
-        for file_path in markdown_files:
-            # Skip hidden files and directories
-            if any(part.startswith(".") for part in file_path.parts):
-                continue
+        Args:
+            signatures: Result of file_signatures() to reuse instead of
+                walking the vault again
+
+        Yields:
+            SKOSConcept objects
+        """
+        signatures, results, pending = self._scan(signatures)
+
+        workers = self.max_workers
+        if workers == 1 or len(pending) < PARALLEL_THRESHOLD:
+            yield from self._merge_parsed(
+                signatures, results, map(self._parse_concept, pending)
+            )
+        else:
+            chunksize = max(1, len(pending) // (workers * 4))
+            # Spawned, not forked: the server's event loop and log listener
+            # threads would be copied into forked children mid-operation
+            context = multiprocessing.get_context("spawn")
+            log_queue = context.Queue()
+            log_listener = QueueListener(log_queue, ReplayHandler())
+            log_listener.start()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(
+                        self.vault_path,
+                        log_queue,
+                        logging.getLogger().getEffectiveLevel(),
+                    ),
+                ) as executor:
+                    parsed = executor.map(_extract_one, pending, chunksize=chunksize)
+                    yield from self._merge_parsed(
+                        signatures, results, self._interned(parsed)
+                    )
+            finally:
+                log_listener.stop()
+
+        self._finish_scan(signatures, results)
+
+    @staticmethod
+    def _interned(
+        concepts: Iterable[Optional[SKOSConcept]],
+    ) -> Iterator[Optional[SKOSConcept]]:
+        """
+        Re-intern the IDs of concepts coming back from pool workers.
 
-            concept = self.extract_concept(file_path)
+        Args:
+            concepts: Parsed concepts (None for non-concept files)
+
+        Yields:
+            The same concepts
+        """
+        for concept in concepts:
+            if concept:
+                _intern_ids(concept)
+            yield concept
+
+    @staticmethod
+    def _merge_parsed(
+        signatures: Signatures,
+        results: Dict[str, Optional[SKOSConcept]],
+        parsed: Iterable[Optional[SKOSConcept]],
+    ) -> Iterator[SKOSConcept]:
+        """
+        Interleave cache hits with freshly parsed files in walk order.
+
+        Args:
+            signatures: File signatures from _scan(), in walk order
+            results: Cache hits from _scan(); parsed results are added
+            parsed: Results for the files to parse, in walk order
+
+        Yields:
+            Concepts in walk order
+        """
+        parsed = iter(parsed)
+        for key in signatures:
+            if key in results:
+                concept = results[key]
+            else:
+                concept = results[key] = next(parsed)
             if concept:
-                concepts.append(concept)
+                yield concept
+
+    async def extract_all_concepts_async(self) -> List[SKOSConcept]:
+        """
+        Extract all SKOS concepts, overlapping file reads in one process.
+
+        Useful where a process pool is unavailable or slow to start, and on
+        high-latency storage (network shares, spinning disks).
+
+        Returns:
+            List of SKOSConcept objects
+        """
+        signatures, results, pending = self._scan()
+        semaphore = asyncio.Semaphore(ASYNC_READ_LIMIT)
+
+        async def parse(file_path: Path) -> Optional[SKOSConcept]:
+            async with semaphore:
+                metadata = await self.parser.parse_file_async(file_path)
+            return self._build_concept(file_path, metadata) if metadata else None
+
+        parsed = await asyncio.gather(*[parse(file_path) for file_path in pending])
+        for file_path, concept in zip(pending, parsed, strict=True):
+            results[str(file_path)] = concept
+
+        return self._finish_scan(signatures, results)
+
+    def extract_all_concepts_concurrent(self) -> List[SKOSConcept]:
+        """
+        Synchronous wrapper around extract_all_concepts_async().
+
+        Returns:
+            List of SKOSConcept objects
+        """
+        return asyncio.run(self.extract_all_concepts_async())
+
+    def iter_files(self) -> Iterator[Path]:
+        """
+        Iterate over the vault's markdown files, skipping hidden entries.
+
+        Yields:
+            Paths of markdown files, in walk order
+        """
+        return map(Path, _walk_md(str(self.vault_path)))
+
+    def file_signatures(self) -> Signatures:
+        """
+        Walk the vault and stat every markdown file.
+
+        Returns:
+            File path -> (mtime_ns, size), in walk order
+        """
+        return {
+            str(file_path): self._file_signature(file_path)
+            for file_path in self.iter_files()
+        }
+
+    def fingerprint(self, signatures: Optional[Signatures] = None) -> str:
+        """
+        Hash the vault's markdown file paths and signatures.
+
+        The result changes whenever a markdown file is added, removed or
+        modified (or the concept layout changes), so it can key caches of
+        anything derived from the whole vault.
+
+        Args:
+            signatures: Result of file_signatures() (walks the vault if None)
+
+        Returns:
+            Hex digest
+        """
+        if signatures is None:
+            signatures = self.file_signatures()
+
+        digest = hashlib.blake2b(f"v{CACHE_VERSION}".encode(), digest_size=16)
+        for key, (mtime_ns, size) in sorted(signatures.items()):
+            digest.update(f"\0{key}\0{mtime_ns}\0{size}".encode())
+        return digest.hexdigest()
+
+    def _scan(
+        self, signatures: Optional[Signatures] = None
+    ) -> Tuple[Signatures, Dict[str, Optional[SKOSConcept]], List[Path]]:
+        """
+        Split the vault's files into cache hits and files to parse.
+
+        Args:
+            signatures: Result of file_signatures() (walks the vault if None)
+
+        Returns:
+            Tuple of (file signatures, cached results, paths to parse)
+        """
+        if signatures is None:
+            signatures = self.file_signatures()
+
+        self.logger.info(f"Scanning {len(signatures)} markdown files in vault")
+
+        # Reuse cached results for files unchanged since the last scan
+        results: Dict[str, Optional[SKOSConcept]] = {}
+        pending: List[Path] = []
+        for key, signature in signatures.items():
+            entry = self._cache.get(key)
+            if entry is not None and entry[:2] == signature:
+                results[key] = entry[2]
+            else:
+                pending.append(Path(key))
+
+        self.logger.info(f"Parsing {len(pending)} new or changed files")
+        return signatures, results, pending
+
+    def _finish_scan(
+        self,
+        signatures: Signatures,
+        results: Dict[str, Optional[SKOSConcept]],
+    ) -> List[SKOSConcept]:
+        """
+        Store scan results in the cache and collect the concepts.
+
+        Args:
+            signatures: File signatures from _scan()
+            results: Concept (or None) per scanned file
+
+        Returns:
+            List of SKOSConcept objects in walk order
+        """
+        # Rebuild the cache from this scan so deleted files drop out. Walk
+        # order comes from signatures: results holds cache hits before the
+        # freshly parsed files
+        self._cache = {
+            key: (*signature, results[key]) for key, signature in signatures.items()
+        }
+        self._save_cache()
+
+        concepts = [entry[2] for entry in self._cache.values() if entry[2]]
 
         self.logger.info(f"Extracted {len(concepts)} SKOS concepts")
         return concepts
@@ -115,6 +520,26 @@ class SKOSExtractor:
         """
         Extract a single concept from a file.
 
+        Args:
+            file_path: Path to markdown file
+
+        Returns:
+            SKOSConcept or None if not a valid concept
+        """
+        key = str(file_path)
+        signature = self._file_signature(file_path)
+        entry = self._cache.get(key)
+        if entry is not None and entry[:2] == signature:
+            return entry[2]
+
+        concept = self._parse_concept(file_path)
+        self._cache[key] = (*signature, concept)
+        return concept
+
+    def _parse_concept(self, file_path: Path) -> Optional[SKOSConcept]:
+        """
+        Parse a file into a concept, bypassing the cache.
+
         Args:
             file_path: Path to markdown file
 
@@ -124,19 +549,28 @@ class SKOSExtractor:
         metadata = self.parser.parse_file(file_path)
         if not metadata:
             return None
+        return self._build_concept(file_path, metadata)
 
+    def _build_concept(
+        self, file_path: Path, metadata: ConceptMetadata
+    ) -> SKOSConcept:
+        """
+        Build a concept from parsed frontmatter metadata.
+
+        Args:
+            file_path: Path to markdown file
+            metadata: Parsed metadata
+
+        Returns:
+            SKOSConcept object
+        """
         # Generate concept ID from file name
         concept_id = self._generate_concept_id(file_path)
 
         # Generate URI
         uri = f"vault://concepts#{concept_id}"
 
-        # Resolve wikilink relations to concept IDs
-        broader_ids = [self._wikilink_to_concept_id(link) for link in metadata.broader]
-        narrower_ids = [self._wikilink_to_concept_id(link) for link in metadata.narrower]
-        related_ids = [self._wikilink_to_concept_id(link) for link in metadata.related]
-        prerequisite_ids = [self._wikilink_to_concept_id(link) for link in metadata.prerequisite]
-
+        # Relations are resolved from wikilink titles to concept IDs
         concept = SKOSConcept(
             concept_id=concept_id,
             uri=uri,
@@ -145,9 +579,9 @@ class SKOSExtractor:
             definition=metadata.definition,
             notation=metadata.notation,
             in_scheme=metadata.in_scheme,
-            broader=broader_ids,
-            narrower=narrower_ids,
-            related=related_ids,
+            broader=_norm_many(metadata.broader),
+            narrower=_norm_many(metadata.narrower),
+            related=_norm_many(metadata.related),
             schema_type=metadata.schema_type,
             about=metadata.about,
             teaches=metadata.teaches,
@@ -155,38 +589,83 @@ class SKOSExtractor:
             learning_resource_type=metadata.learning_resource_type,
             course=metadata.course,
             lecture_week=metadata.lecture_week,
-            prerequisite=prerequisite_ids,
+            prerequisite=_norm_many(metadata.prerequisite),
             file_path=file_path,
-            content=metadata.content or "",
+            body_offset=metadata.body_offset,
         )
 
         return concept
 
-    def _generate_concept_id(self, file_path: Path) -> str:
+    @staticmethod
+    def _file_signature(file_path: Path) -> Tuple[int, int]:
         """
-        Generate concept ID from file path.
+        Get the (mtime_ns, size) pair used to detect changed files.
 
         Args:
             file_path: Path to markdown file
 
         Returns:
-            Concept ID (lowercase, underscores)
+            Tuple of modification time in nanoseconds and size in bytes
+        """
+        stat = file_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_cache(self) -> Dict[str, Tuple[int, int, Optional[SKOSConcept]]]:
         """
-        # Use file stem (name without extension)
-        name = file_path.stem
-        # Convert to lowercase and replace spaces with underscores
-        concept_id = name.lower().replace(" ", "_").replace("-", "_")
-        return concept_id
+        Load the parse cache from disk.
 
-    def _wikilink_to_concept_id(self, wikilink: str) -> str:
+        Returns:
+            Cache entries, empty if caching is disabled or the cache is unusable
         """
-        Convert wikilink to concept ID.
+        if self.cache_file is None or not self.cache_file.exists():
+            return {}
+
+        try:
+            data = orjson.loads(self.cache_file.read_bytes())
+            if data["version"] != CACHE_VERSION:
+                return {}
+            entries = {
+                key: (mtime_ns, size, _concept_from_row(row) if row else None)
+                for key, mtime_ns, size, row in data["entries"]
+            }
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache {self.cache_file}: {e}")
+            return {}
+
+        for _, _, concept in entries.values():
+            if concept:
+                _intern_ids(concept)
+        return entries
+
+    def _save_cache(self) -> None:
+        """Atomically write the parse cache to disk."""
+        if self.cache_file is None:
+            return
+
+        data = {
+            "version": CACHE_VERSION,
+            "entries": [
+                (key, mtime_ns, size, _concept_to_row(concept) if concept else None)
+                for key, (mtime_ns, size, concept) in self._cache.items()
+            ],
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            tmp_file.write_bytes(orjson.dumps(data))
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache {self.cache_file}: {e}")
+
+    def _generate_concept_id(self, file_path: Path) -> str:
+        """
+        Generate concept ID from file path.
 
         Args:
-            wikilink: Note title from wikilink
+            file_path: Path to markdown file
 
         Returns:
-            Concept ID
+            Concept ID (lowercase, underscores)
         """
-        # Convert to lowercase and replace spaces with underscores
-        return wikilink.lower().replace(" ", "_").replace("-", "_")
+        # Use file stem (name without extension), lowercased with underscores
+        return intern(file_path.stem.lower().translate(_ID_TRANS))
@@ -1,7 +1,14 @@
 """Knowledge graph construction and querying."""
 
 from .builder import KnowledgeGraphBuilder
+from .csr import CSRAdjacency
 from .indexer import GraphIndexer
-from .query import GraphQueryEngine
+from .query import GraphQueryEngine, LazyQueryEngine
 
-__all__ = ["KnowledgeGraphBuilder", "GraphIndexer", "GraphQueryEngine"]
+__all__ = [
+    "CSRAdjacency",
+    "KnowledgeGraphBuilder",
+    "GraphIndexer",
+    "GraphQueryEngine",
+    "LazyQueryEngine",
+]
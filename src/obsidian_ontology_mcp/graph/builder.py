@@ -1,14 +1,62 @@
 """Knowledge graph builder using NetworkX."""
 
 import logging
-from typing import Dict, List, Optional
+from sys import intern
+from typing import Container, Dict, Iterable, List, Optional, Tuple
 
 import networkx as nx
 
 from ..extraction.skos_extractor import SKOSConcept
+from .csr import CSRAdjacency
 
 logger = logging.getLogger(__name__)
 
+RELATION_TYPES = ("broader", "narrower", "related", "prerequisite")
+
+
+def collect_relations(
+    concepts: Iterable[SKOSConcept],
+    known: Container[str],
+    edge_types: Dict[Tuple[str, str], str],
+) -> None:
+    """
+    Collect concept relations as typed edges.
+
+    An edge holds a single relation type. Concepts are processed in order
+    and explicit relations overwrite earlier ones, while narrower relations
+    (and their inverses) only fill in edges not already present.
+
+    Args:
+        concepts: SKOS concepts
+        known: Concept IDs that exist in the graph (other targets are skipped)
+        edge_types: (source, target) -> relation type, updated in place
+    """
+    # Bound once for the whole loop
+    is_known = known.__contains__
+    setdefault = edge_types.setdefault
+
+    for concept in concepts:
+        concept_id = concept.concept_id
+
+        # Add broader relations and their inverse narrower relations
+        for broader_id in filter(is_known, concept.broader):
+            edge_types[concept_id, broader_id] = "broader"
+            edge_types[broader_id, concept_id] = "narrower"
+
+        # Add narrower relations (if not already added via broader)
+        for narrower_id in filter(is_known, concept.narrower):
+            setdefault((concept_id, narrower_id), "narrower")
+            setdefault((narrower_id, concept_id), "broader")
+
+        # Add related relations (bidirectional)
+        for related_id in filter(is_known, concept.related):
+            edge_types[concept_id, related_id] = "related"
+            edge_types[related_id, concept_id] = "related"
+
+        # Add prerequisite relations
+        for prereq_id in filter(is_known, concept.prerequisite):
+            edge_types[concept_id, prereq_id] = "prerequisite"
+
 
 class KnowledgeGraphBuilder:
     """Builds a directed graph from SKOS concepts."""
@@ -18,6 +66,18 @@ class KnowledgeGraphBuilder:
         self.graph = nx.DiGraph()
         self.logger = logging.getLogger(__name__)
 
+        # concept_id -> integer node id, assigned on first sighting
+        self.id_of: Dict[str, int] = {}
+
+        # Undirected CSR snapshot for path finding (None until built or after updates)
+        self.csr: Optional[CSRAdjacency] = None
+
+        # Per-relation-type CSR adjacency (None until built or after updates)
+        self.relations: Optional[Dict[str, CSRAdjacency]] = None
+
+        # Last get_statistics() result (None when the graph has changed)
+        self._stats: Optional[Dict] = None
+
     def build_graph(self, concepts: List[SKOSConcept]) -> nx.DiGraph:
         """
         Build knowledge graph from concepts.
@@ -30,13 +90,28 @@ class KnowledgeGraphBuilder:
         """
         self.logger.info(f"Building graph from {len(concepts)} concepts")
 
-        # Add all nodes first
-        for concept in concepts:
-            self._add_concept_node(concept)
+        # Concepts sharing an ID (same note name in different folders) are
+        # one node: the last one wins, at the position of the first
+        latest = {intern(concept.concept_id): concept for concept in concepts}
+        self._log_duplicates(len(concepts), len(latest))
+
+        # Pass 1: assign ids and add all nodes in one batch
+        id_of = self.id_of
+        for concept_id in latest:
+            id_of.setdefault(concept_id, len(id_of))
+        self.graph.add_nodes_from(
+            (concept_id, {"obj": concept}) for concept_id, concept in latest.items()
+        )
 
-        # Add edges (relations)
-        for concept in concepts:
-            self._add_concept_relations(concept)
+        # Pass 2: collect typed edges, deduplicated by (source, target);
+        # replaced duplicates contribute no relations
+        edge_types: Dict[Tuple[str, str], str] = {}
+        collect_relations(latest.values(), self.graph._node, edge_types)
+        self._add_edges(edge_types)
+
+        self.relations = self._build_relations(edge_types)
+        self.csr = CSRAdjacency.from_graph(self.graph, undirected=True)
+        self._stats = None
 
         self.logger.info(
             f"Graph built: {self.graph.number_of_nodes()} nodes, "
@@ -45,81 +120,151 @@ class KnowledgeGraphBuilder:
 
         return self.graph
 
+    def build_graph_streaming(self, concepts: Iterable[SKOSConcept]) -> nx.DiGraph:
+        """
+        Build knowledge graph from concepts as they are produced.
+
+        Nodes are added as concepts arrive, so extraction overlaps with
+        graph construction and no list of concepts is kept. Relations are
+        then read back from the node payloads; a concept replaced by a
+        later one with the same ID contributes no relations.
+
+        Args:
+            concepts: SKOS concepts, e.g. SKOSExtractor.iter_concepts()
+
+        Returns:
+            NetworkX DiGraph
+        """
+        # Pass 1: assign ids and add nodes one at a time
+        graph = self.graph
+        id_of = self.id_of
+        existing = len(graph._node)
+        count = 0
+        for concept in concepts:
+            count += 1
+            concept_id = intern(concept.concept_id)
+            id_of.setdefault(concept_id, len(id_of))
+            graph.add_node(concept_id, obj=concept)
+
+        self.logger.info(f"Building graph from {count} concepts")
+        self._log_duplicates(count, len(graph._node) - existing)
+
+        # Pass 2: collect typed edges, deduplicated by (source, target)
+        edge_types: Dict[Tuple[str, str], str] = {}
+        collect_relations(
+            (node["obj"] for node in graph._node.values()), graph._node, edge_types
+        )
+        self._add_edges(edge_types)
+
+        self.relations = self._build_relations(edge_types)
+        self.csr = CSRAdjacency.from_graph(graph, undirected=True)
+        self._stats = None
+
+        self.logger.info(
+            f"Graph built: {graph.number_of_nodes()} nodes, "
+            f"{graph.number_of_edges()} edges"
+        )
+
+        return graph
+
+    def _log_duplicates(self, concepts: int, nodes: int) -> None:
+        """
+        Report concepts merged into an existing node with the same ID.
+
+        Args:
+            concepts: Number of concepts received
+            nodes: Number of distinct concept IDs among them
+        """
+        if concepts > nodes:
+            self.logger.warning(
+                f"Merged {concepts - nodes} duplicate concept IDs "
+                f"(the last concept with each ID is kept)"
+            )
+
     def _add_concept_node(self, concept: SKOSConcept) -> None:
         """
-        Add concept as a node to the graph.
+        Add or replace a single concept node (build_graph adds nodes in bulk).
 
         Args:
             concept: SKOS concept
         """
-        # Convert concept to dictionary for node attributes
-        node_data = concept.to_dict()
+        # Store the concept itself; to_dict() is only built for callers of
+        # get_concept. Keyed by the interned ID so every dict and set
+        # holding it shares one string object
+        self.graph.add_node(intern(concept.concept_id), obj=concept)
+
+    def _add_edges(self, edge_types: Dict[Tuple[str, str], str]) -> None:
+        """
+        Bulk-insert typed edges into the graph.
 
-        # Add node with all attributes
-        self.graph.add_node(concept.concept_id, **node_data)
+        Args:
+            edge_types: (source, target) -> relation type
+        """
+        self.graph.add_edges_from(
+            (source, target, {"relation_type": relation_type})
+            for (source, target), relation_type in edge_types.items()
+        )
 
-    def _add_concept_relations(self, concept: SKOSConcept) -> None:
+    def _build_relations(
+        self, edge_types: Dict[Tuple[str, str], str]
+    ) -> Dict[str, CSRAdjacency]:
         """
-        Add concept relations as edges.
+        Pack typed edges into one CSR adjacency per relation type.
 
         Args:
-            concept: SKOS concept
+            edge_types: (source, target) -> relation type
+
+        Returns:
+            Relation type -> CSRAdjacency over the builder's integer ids
         """
-        # Add broader relations
-        for broader_id in concept.broader:
-            if self.graph.has_node(broader_id):
-                self.graph.add_edge(
-                    concept.concept_id,
-                    broader_id,
-                    relation_type="broader",
-                )
-                # Add inverse narrower relation
-                self.graph.add_edge(
-                    broader_id,
-                    concept.concept_id,
-                    relation_type="narrower",
-                )
+        id_of = self.id_of
+        nodes = list(id_of)
+        edges: Dict[str, List[Tuple[int, int]]] = {rt: [] for rt in RELATION_TYPES}
+        for (source, target), relation_type in edge_types.items():
+            edges[relation_type].append((id_of[source], id_of[target]))
 
-        # Add narrower relations (if not already added via broader)
-        for narrower_id in concept.narrower:
-            if self.graph.has_node(narrower_id):
-                if not self.graph.has_edge(concept.concept_id, narrower_id):
-                    self.graph.add_edge(
-                        concept.concept_id,
-                        narrower_id,
-                        relation_type="narrower",
-                    )
-                # Add inverse broader relation
-                if not self.graph.has_edge(narrower_id, concept.concept_id):
-                    self.graph.add_edge(
-                        narrower_id,
-                        concept.concept_id,
-                        relation_type="broader",
-                    )
+        return {
+            relation_type: CSRAdjacency.from_edges(nodes, id_of, pairs)
+            for relation_type, pairs in edges.items()
+        }
 
-        # Add related relations (bidirectional)
-        for related_id in concept.related:
-            if self.graph.has_node(related_id):
-                self.graph.add_edge(
-                    concept.concept_id,
-                    related_id,
-                    relation_type="related",
-                )
-                # Add inverse relation
-                self.graph.add_edge(
-                    related_id,
-                    concept.concept_id,
-                    relation_type="related",
-                )
+    def get_related_concepts(self, concept_id: str, relation_type: str) -> List[str]:
+        """
+        Get related concepts by relation type.
 
-        # Add prerequisite relations
-        for prereq_id in concept.prerequisite:
-            if self.graph.has_node(prereq_id):
-                self.graph.add_edge(
-                    concept.concept_id,
-                    prereq_id,
-                    relation_type="prerequisite",
-                )
+        Args:
+            concept_id: Source concept ID
+            relation_type: Type of relation (broader, narrower, related, prerequisite)
+
+        Returns:
+            List of related concept IDs
+        """
+        if self.relations is None:
+            # Rebuild after incremental updates
+            self.id_of = {node: i for i, node in enumerate(self.graph._node)}
+            self.relations = self._build_relations(
+                {
+                    (source, target): data["relation_type"]
+                    for source, target, data in self.graph.edges(data=True)
+                }
+            )
+
+        relation = self.relations.get(relation_type)
+        if relation is None:
+            return []
+        return relation.neighbor_ids(concept_id)
+
+    def _invalidate_snapshots(self) -> None:
+        """Drop the CSR snapshots and cached statistics after the graph changes."""
+        self._stats = None
+        if self.csr is not None:
+            # Cleared in place so query engines holding it fall back too
+            self.csr.clear()
+            self.csr = None
+        if self.relations is not None:
+            # Cleared in place so query engines holding it fall back too
+            self.relations.clear()
+            self.relations = None
 
     def update_concept(self, concept: SKOSConcept) -> None:
         """
@@ -128,21 +273,31 @@ class KnowledgeGraphBuilder:
         Args:
             concept: SKOS concept
         """
-        # Remove old edges if concept exists
-        if self.graph.has_node(concept.concept_id):
-            # Remove all edges involving this concept
-            edges_to_remove = list(self.graph.in_edges(concept.concept_id)) + list(
-                self.graph.out_edges(concept.concept_id)
-            )
-            self.graph.remove_edges_from(edges_to_remove)
+        # CSR snapshots no longer match the graph
+        self._invalidate_snapshots()
+
+        # Remove all edges involving this concept (if it exists)
+        concept_id = concept.concept_id
+        graph = self.graph
+        if concept_id in graph._node:
+            for source in list(graph._pred[concept_id]):
+                del graph._succ[source][concept_id]
+                del graph._pred[concept_id][source]
+            for target in list(graph._succ[concept_id]):
+                del graph._pred[target][concept_id]
+                del graph._succ[concept_id][target]
 
         # Add/update node
         self._add_concept_node(concept)
 
-        # Add new edges
-        self._add_concept_relations(concept)
+        # Add new edges, each exactly once: edge_types is the seen-set, and
+        # none of this concept's old edges remain for the narrower fill-in
+        # rule to consult
+        edge_types: Dict[Tuple[str, str], str] = {}
+        collect_relations([concept], graph._node, edge_types)
+        self._add_edges(edge_types)
 
-        self.logger.info(f"Updated concept: {concept.concept_id}")
+        self.logger.info(f"Updated concept: {concept_id}")
 
     def remove_concept(self, concept_id: str) -> None:
         """
@@ -152,6 +307,7 @@ class KnowledgeGraphBuilder:
             concept_id: Concept ID to remove
         """
         if self.graph.has_node(concept_id):
+            self._invalidate_snapshots()
             self.graph.remove_node(concept_id)
             self.logger.info(f"Removed concept: {concept_id}")
 
@@ -165,20 +321,52 @@ class KnowledgeGraphBuilder:
         Returns:
             Concept data dictionary or None
         """
-        if self.graph.has_node(concept_id):
-            return dict(self.graph.nodes[concept_id])
-        return None
+        node = self.graph._node.get(concept_id)
+        if node is None:
+            return None
+        concept: SKOSConcept = node["obj"]
+        return concept.to_dict()
 
     def get_statistics(self) -> Dict:
         """
         Get graph statistics.
 
+        Cached until the graph changes.
+
         Returns:
             Dictionary with graph metrics
         """
-        return {
-            "total_concepts": self.graph.number_of_nodes(),
-            "total_relations": self.graph.number_of_edges(),
-            "density": nx.density(self.graph),
-            "is_connected": nx.is_weakly_connected(self.graph),
-        }
+        if self._stats is None:
+            # Connectivity from the undirected CSR snapshot when available
+            if self.csr is not None and self.csr.nodes:
+                is_connected = self.csr.is_connected()
+            else:
+                is_connected = nx.is_weakly_connected(self.graph)
+
+            # Same value as nx.density, without recounting the edges
+            n, m = self._counts()
+            density = m / (n * (n - 1)) if n > 1 else 0
+
+            self._stats = {
+                "total_concepts": n,
+                "total_relations": m,
+                "density": density,
+                "is_connected": is_connected,
+            }
+        return dict(self._stats)
+
+    def _counts(self) -> Tuple[int, int]:
+        """
+        Count nodes and edges.
+
+        Edges are counted from the per-relation CSR snapshot (one entry per
+        edge) while it is valid; counting graph edges walks every node.
+
+        Returns:
+            (number of nodes, number of edges)
+        """
+        if self.relations:
+            total_relations = sum(len(r.indices) for r in self.relations.values())
+        else:
+            total_relations = self.graph.number_of_edges()
+        return len(self.graph._node), total_relations
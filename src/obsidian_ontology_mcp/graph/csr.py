@@ -0,0 +1,235 @@
+"""Compressed sparse row (CSR) adjacency for integer-indexed traversal."""
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from itertools import accumulate, chain
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import networkx as nx
+
+
+def bfs_levels(
+    adjacency: Sequence[Tuple[array, array]],
+    source: int,
+    n: int,
+    max_depth: int,
+) -> Tuple[array, array, array]:
+    """
+    Level-synchronous breadth-first search over several CSR adjacencies.
+
+    Works on integer ids only. Each frontier is expanded node by node and,
+    for every node, adjacency by adjacency, so nodes are discovered in the
+    same order as a queue-based BFS.
+
+    Args:
+        adjacency: (indptr, indices) pairs sharing one node numbering
+        source: Starting node index
+        n: Number of nodes
+        max_depth: Maximum traversal depth
+
+    Returns:
+        Parallel arrays of discovered node indices, the depth of the node
+        each was reached from, and the position in ``adjacency`` of the
+        edge used, in discovery order
+    """
+    visited = bytearray(n)
+    visited[source] = 1
+    reached = array("i")
+    depths = array("i")
+    kinds = array("i")
+
+    # The discovery array doubles as the frontier queue
+    frontier = array("i", [source])
+    for depth in range(max_depth):
+        level_start = len(reached)
+        for u in frontier:
+            for kind, (indptr, indices) in enumerate(adjacency):
+                for v in indices[indptr[u] : indptr[u + 1]]:
+                    if not visited[v]:
+                        visited[v] = 1
+                        reached.append(v)
+                        depths.append(depth)
+                        kinds.append(kind)
+        if len(reached) == level_start:
+            break
+        frontier = reached[level_start:]
+
+    return reached, depths, kinds
+
+
+@dataclass(slots=True)
+class CSRAdjacency:
+    """
+    Adjacency lists packed into two contiguous int32 arrays.
+
+    The neighbors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``.
+    """
+
+    nodes: List[str]  # index -> concept_id
+    index: Dict[str, int]  # concept_id -> index
+    indptr: array
+    indices: array
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph, undirected: bool = False) -> "CSRAdjacency":
+        """
+        Pack a NetworkX graph into CSR arrays.
+
+        Args:
+            graph: NetworkX DiGraph
+            undirected: Treat edges as undirected (successors + predecessors)
+
+        Returns:
+            CSRAdjacency snapshot of the graph
+        """
+        nodes = list(graph._node)
+        index = {node: i for i, node in enumerate(nodes)}
+        adj = graph._adj
+        pred = graph._pred
+
+        indptr = array("i", [0])
+        indices = array("i")
+        for node in nodes:
+            neighbors: Iterable[str] = adj[node]
+            if undirected:
+                neighbors = dict.fromkeys(chain(adj[node], pred[node]))
+            indices.extend([index[neighbor] for neighbor in neighbors])
+            indptr.append(len(indices))
+
+        return cls(nodes=nodes, index=index, indptr=indptr, indices=indices)
+
+    @classmethod
+    def from_edges(
+        cls,
+        nodes: List[str],
+        index: Dict[str, int],
+        edges: Sequence[Tuple[int, int]],
+    ) -> "CSRAdjacency":
+        """
+        Pack integer edge pairs into CSR arrays with a counting sort.
+
+        Edges keep their relative order within each source node.
+
+        Args:
+            nodes: Index -> concept ID
+            index: Concept ID -> index
+            edges: (source index, target index) pairs
+
+        Returns:
+            CSRAdjacency holding the given edges
+        """
+        counts = [0] * (len(nodes) + 1)
+        for src, _ in edges:
+            counts[src + 1] += 1
+        indptr = array("i", accumulate(counts))
+
+        indices = array("i", [0]) * len(edges)
+        fill = indptr.tolist()
+        for src, dst in edges:
+            indices[fill[src]] = dst
+            fill[src] += 1
+
+        return cls(nodes=nodes, index=index, indptr=indptr, indices=indices)
+
+    def clear(self) -> None:
+        """
+        Empty the snapshot in place, so every holder sees a graph-less CSR.
+
+        The arrays are replaced rather than truncated, since other
+        snapshots may share them.
+        """
+        self.nodes = []
+        self.index = {}
+        self.indptr = array("i", [0])
+        self.indices = array("i")
+
+    def neighbor_ids(self, node: str) -> List[str]:
+        """
+        Get neighbor concept IDs of a node.
+
+        Args:
+            node: Concept ID
+
+        Returns:
+            List of neighbor concept IDs (empty if the node is unknown)
+        """
+        i = self.index.get(node)
+        if i is None:
+            return []
+        nodes = self.nodes
+        return [nodes[j] for j in self.indices[self.indptr[i] : self.indptr[i + 1]]]
+
+    def neighbors(self, i: int) -> array:
+        """
+        Get neighbor indices of a node.
+
+        Args:
+            i: Node index
+
+        Returns:
+            Array of neighbor indices
+        """
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+    def is_connected(self) -> bool:
+        """
+        Check whether every node is reachable from the first one.
+
+        On an undirected snapshot this is weak connectivity of the graph.
+
+        Returns:
+            True if the graph has a single connected component
+        """
+        n = len(self.nodes)
+        indptr = self.indptr
+        indices = self.indices
+
+        visited = bytearray(n)
+        visited[0] = 1
+        stack = [0]
+        seen = 1
+        while stack:
+            u = stack.pop()
+            for v in indices[indptr[u] : indptr[u + 1]]:
+                if not visited[v]:
+                    visited[v] = 1
+                    seen += 1
+                    stack.append(v)
+        return seen == n
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """
+        Find an unweighted shortest path with breadth-first search.
+
+        Args:
+            source: Source concept ID
+            target: Target concept ID
+
+        Returns:
+            List of concept IDs from source to target, or None if unreachable
+        """
+        src = self.index[source]
+        dst = self.index[target]
+        indptr = self.indptr
+        indices = self.indices
+
+        # predecessor[i] == -1 marks unvisited nodes
+        predecessor = array("i", [-1]) * len(self.nodes)
+        predecessor[src] = src
+        queue = deque([src])
+
+        while queue and predecessor[dst] == -1:
+            u = queue.popleft()
+            for v in indices[indptr[u] : indptr[u + 1]]:
+                if predecessor[v] == -1:
+                    predecessor[v] = u
+                    queue.append(v)
+
+        if predecessor[dst] == -1:
+            return None
+
+        path = [dst]
+        while path[-1] != src:
+            path.append(predecessor[path[-1]])
+        return [self.nodes[i] for i in reversed(path)]
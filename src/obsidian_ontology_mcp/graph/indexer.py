@@ -1,57 +1,132 @@
 """Multi-index system for fast concept lookups."""
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Set
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from sys import intern
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import networkx as nx
 
+from ..extraction.skos_extractor import SKOSConcept
+from .builder import RELATION_TYPES, collect_relations
+from .csr import CSRAdjacency
+
 logger = logging.getLogger(__name__)
 
+# Text search indexes character trigrams; shorter queries fall back to a scan
+NGRAM = 3
+
+
+def _gil_enabled() -> bool:
+    """Check whether the interpreter runs with the GIL (always before 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
 
 class GraphIndexer:
     """Builds and maintains indexes for fast concept lookups."""
 
-    def __init__(self, graph: nx.DiGraph) -> None:
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        concepts: Optional[List[SKOSConcept]] = None,
+        relations: Optional[Dict[str, CSRAdjacency]] = None,
+        workers: int = 1,
+    ) -> None:
         """
         Initialize indexer.
 
         Args:
             graph: NetworkX graph to index
+            concepts: Concepts the graph was built from; when given, the
+                relation index is derived from them instead of the graph edges
+            relations: The builder's per-relation-type CSR snapshot of the
+                graph; when given, the relation index is unpacked from it
+                instead (takes precedence over concepts)
+            workers: Threads for building the label, text and relation
+                indexes side by side (only used without the GIL)
         """
         self.graph = graph
+        self.workers = workers
         self.logger = logging.getLogger(__name__)
 
         # Indexes
+        # Label keys are casefolded for case-insensitive lookup
         self.label_index: Dict[str, str] = {}  # label -> concept_id
-        self.alt_label_index: Dict[str, str] = {}  # alt_label -> concept_id
+        self.alt_label_index: Dict[str, List[str]] = {}  # alt_label -> [concept_ids]
         self.notation_index: Dict[str, str] = {}  # notation -> concept_id
-        self.relation_index: Dict[str, Dict[str, List[str]]] = {}  # relation_type -> {concept_id -> [related_ids]}
+        self.relation_index: Dict[str, Dict[str, Tuple[str, ...]]] = {}  # relation_type -> {concept_id -> (related_ids)}
 
-        self._build_indexes()
+        # Inverted index for text search: trigram -> {node ordinal}
+        self._node_ids: List[str] = []
+        self._ordinals: Dict[str, int] = {}  # concept_id -> node ordinal
+        self._trigrams: Dict[str, Set[int]] = {}
 
-    def _build_indexes(self) -> None:
-        """Build all indexes from graph."""
-        self.logger.info("Building indexes...")
+        # Lowercased searchable text, parallel to _node_ids
+        self._lc_pref: List[str] = []
+        self._lc_alt: List[List[str]] = []
+        self._lc_def: List[str] = []
+
+        # CSR projection of relation_index (see relation_csr()); starts as the
+        # builder's snapshot when given, None once the index is patched
+        self._relation_csr: Optional[Dict[str, CSRAdjacency]] = relations or None
 
-        for node_id, node_data in self.graph.nodes(data=True):
-            # Label index (lowercase for case-insensitive search)
-            pref_label = node_data.get("prefLabel", "")
-            if pref_label:
-                self.label_index[pref_label.lower()] = node_id
+        self._build_indexes(concepts, relations)
 
-            # Alt label index
-            alt_labels = node_data.get("altLabel", [])
-            for alt_label in alt_labels:
-                if alt_label:
-                    self.alt_label_index[alt_label.lower()] = node_id
+    def _build_indexes(
+        self,
+        concepts: Optional[List[SKOSConcept]] = None,
+        relations: Optional[Dict[str, CSRAdjacency]] = None,
+    ) -> None:
+        """
+        Build all indexes.
 
-            # Notation index
-            notation = node_data.get("notation")
-            if notation:
-                self.notation_index[notation] = node_id
+        Args:
+            concepts: Concepts the graph was built from (optional); when
+                given, they are read instead of the concepts stored on nodes
+            relations: Per-relation-type CSR snapshot of the graph (optional)
+        """
+        self.logger.info("Building indexes...")
 
-        # Relation index
-        self._build_relation_index()
+        entries: List[Tuple[str, SKOSConcept]]
+        if concepts is not None:
+            # Later duplicates replace earlier ones in place, as in the graph
+            latest = {concept.concept_id: concept for concept in concepts}
+            entries = list(latest.items())
+        else:
+            entries = list(self.graph.nodes(data="obj"))
+
+        def index_labels() -> None:
+            for node_id, c in entries:
+                self._index_labels(node_id, c.pref_label, c.alt_labels, c.notation)
+
+        def index_text() -> None:
+            for node_id, c in entries:
+                self._index_text(node_id, c.pref_label, c.alt_labels, c.definition)
+
+        def index_relations() -> None:
+            if relations:
+                self._build_relation_index_from_csr(relations)
+            elif concepts is not None:
+                # Only the concepts that became graph nodes, as in the builder
+                self._build_relation_index_from_concepts([c for _, c in entries])
+            else:
+                self._build_relation_index()
+
+        # The three tasks fill disjoint indexes and only read the graph, so
+        # they can run concurrently; under the GIL threads would only add
+        # overhead to this pure-Python work
+        tasks: List[Callable[[], None]] = [index_labels, index_text, index_relations]
+        if self.workers > 1 and not _gil_enabled():
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(tasks))) as pool:
+                for future in [pool.submit(task) for task in tasks]:
+                    future.result()
+        else:
+            for task in tasks:
+                task()
 
         self.logger.info(
             f"Indexes built: {len(self.label_index)} labels, "
@@ -61,7 +136,7 @@ class GraphIndexer:
 
     def _build_relation_index(self) -> None:
         """Build relation index for fast relation lookups."""
-        self.relation_index = {
+        buckets: Dict[str, Dict[str, List[str]]] = {
             "broader": {},
             "narrower": {},
             "related": {},
@@ -70,10 +145,256 @@ class GraphIndexer:
 
         for source, target, edge_data in self.graph.edges(data=True):
             relation_type = edge_data.get("relation_type")
-            if relation_type in self.relation_index:
-                if source not in self.relation_index[relation_type]:
-                    self.relation_index[relation_type][source] = []
-                self.relation_index[relation_type][source].append(target)
+            if relation_type in buckets:
+                buckets[relation_type].setdefault(source, []).append(target)
+
+        self._freeze_relation_index(buckets)
+
+    def _build_relation_index_from_concepts(self, concepts: List[SKOSConcept]) -> None:
+        """
+        Build relation index from concept relation lists.
+
+        Applies the same rules as graph construction (inverse relations,
+        one relation type per edge), without walking the graph edges.
+
+        Args:
+            concepts: Concepts the graph was built from
+        """
+        edge_types: Dict[Tuple[str, str], str] = {}
+        collect_relations(concepts, self.graph._node, edge_types)
+
+        buckets: Dict[str, Dict[str, List[str]]] = {rt: {} for rt in RELATION_TYPES}
+        for (source, target), relation_type in edge_types.items():
+            buckets[relation_type].setdefault(source, []).append(target)
+
+        self._freeze_relation_index(buckets)
+
+    def _build_relation_index_from_csr(
+        self, relations: Dict[str, CSRAdjacency]
+    ) -> None:
+        """
+        Unpack the relation index from the builder's CSR snapshot.
+
+        The builder has already resolved every relation into integer edges,
+        so no relation rules are re-applied here. Neighbors keep the order
+        in which the builder collected them.
+
+        Args:
+            relations: Relation type -> CSRAdjacency
+        """
+        relation_index: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        for relation_type, csr in relations.items():
+            nodes = csr.nodes
+            indptr = csr.indptr
+            indices = csr.indices
+            bucket: Dict[str, Tuple[str, ...]] = {}
+            for i, node_id in enumerate(nodes):
+                start, end = indptr[i], indptr[i + 1]
+                if start != end:
+                    bucket[node_id] = tuple([nodes[j] for j in indices[start:end]])
+            relation_index[relation_type] = bucket
+        self.relation_index = relation_index
+
+    def relation_csr(self) -> Dict[str, CSRAdjacency]:
+        """
+        Get the relation index as per-relation-type CSR arrays.
+
+        Packed from the relation index on first use after an update and
+        reused until the next one, so traversals keep walking flat integer
+        arrays instead of dicts of tuples. All relation types share one
+        node numbering (graph order); relations of removed concepts are
+        left out.
+
+        Returns:
+            Relation type -> CSRAdjacency
+        """
+        # Also rebuilt when the builder has cleared its snapshot in place
+        relations = self._relation_csr
+        if not relations:
+            nodes = list(self.graph._node)
+            index = {node_id: i for i, node_id in enumerate(nodes)}
+            relations = {}
+            for relation_type, bucket in self.relation_index.items():
+                edges = [
+                    (index[source], index[target])
+                    for source, ids in bucket.items()
+                    if source in index
+                    for target in ids
+                    if target in index
+                ]
+                relations[relation_type] = CSRAdjacency.from_edges(nodes, index, edges)
+            self._relation_csr = relations
+        return relations
+
+    def _freeze_relation_index(self, buckets: Dict[str, Dict[str, List[str]]]) -> None:
+        """
+        Store relation buckets as tuples, which are never mutated after build.
+
+        Args:
+            buckets: relation_type -> {concept_id -> [related_ids]}
+        """
+        self.relation_index = {
+            relation_type: {source: tuple(ids) for source, ids in bucket.items()}
+            for relation_type, bucket in buckets.items()
+        }
+        self._relation_csr = None
+
+    def _index_labels(
+        self,
+        node_id: str,
+        pref_label: str,
+        alt_labels: List[str],
+        notation: Optional[str],
+    ) -> None:
+        """
+        Add a concept to the label, alt label and notation indexes.
+
+        Casefolded keys are interned, so repeated labels share one string.
+
+        Args:
+            node_id: Concept ID
+            pref_label: Preferred label
+            alt_labels: Alternative labels
+            notation: Notation code, if any
+        """
+        # Label index
+        if pref_label:
+            self.label_index[intern(pref_label.casefold())] = node_id
+
+        # Alt label index (several concepts may share an alt label)
+        alt_label_index = self.alt_label_index
+        for alt_label in alt_labels:
+            if alt_label:
+                key = intern(alt_label.casefold())
+                alt_label_index.setdefault(key, []).append(node_id)
+
+        # Notation index
+        if notation:
+            self.notation_index[intern(notation)] = node_id
+
+    def _unindex_labels(self, node_id: str, concept: SKOSConcept) -> None:
+        """
+        Remove a concept's entries from the label, alt label and notation indexes.
+
+        Args:
+            node_id: Concept ID
+            concept: Concept as it was indexed
+        """
+        if concept.pref_label:
+            key = concept.pref_label.casefold()
+            if self.label_index.get(key) == node_id:
+                del self.label_index[key]
+
+        for alt_label in concept.alt_labels:
+            if alt_label:
+                key = alt_label.casefold()
+                ids = self.alt_label_index.get(key)
+                if ids and node_id in ids:
+                    ids.remove(node_id)
+                    if not ids:
+                        del self.alt_label_index[key]
+
+        if concept.notation and self.notation_index.get(concept.notation) == node_id:
+            del self.notation_index[concept.notation]
+
+    @staticmethod
+    def _text_grams(pref: str, alts: List[str], definition: str) -> Set[str]:
+        """
+        Collect the trigrams of a concept's lowercased text.
+
+        Args:
+            pref: Lowercased preferred label
+            alts: Lowercased alternative labels
+            definition: Lowercased definition ("" if none)
+
+        Returns:
+            Set of trigrams
+        """
+        grams: Set[str] = set()
+        for text in (pref, *alts, definition):
+            grams.update(text[i : i + NGRAM] for i in range(len(text) - NGRAM + 1))
+        return grams
+
+    def _index_text(
+        self,
+        node_id: str,
+        pref_label: str,
+        alt_labels: List[str],
+        definition: Optional[str],
+    ) -> None:
+        """
+        Add or replace a concept's searchable text in the search indexes.
+
+        A concept already indexed keeps its ordinal, so results stay in
+        graph order.
+
+        Args:
+            node_id: Concept ID
+            pref_label: Preferred label
+            alt_labels: Alternative labels
+            definition: Definition, if any
+        """
+        pref = pref_label.lower()
+        alts = [alt_label.lower() for alt_label in alt_labels]
+        definition = (definition or "").lower()
+
+        trigrams = self._trigrams
+        ordinal = self._ordinals.get(node_id)
+        if ordinal is None:
+            ordinal = len(self._node_ids)
+            self._ordinals[node_id] = ordinal
+            self._node_ids.append(node_id)
+            self._lc_pref.append(pref)
+            self._lc_alt.append(alts)
+            self._lc_def.append(definition)
+        else:
+            old_grams = self._text_grams(
+                self._lc_pref[ordinal], self._lc_alt[ordinal], self._lc_def[ordinal]
+            )
+            for gram in old_grams:
+                postings = trigrams[gram]
+                postings.discard(ordinal)
+                if not postings:
+                    del trigrams[gram]
+            self._lc_pref[ordinal] = pref
+            self._lc_alt[ordinal] = alts
+            self._lc_def[ordinal] = definition
+
+        for gram in self._text_grams(pref, alts, definition):
+            existing = trigrams.get(gram)
+            if existing is None:
+                trigrams[gram] = {ordinal}
+            else:
+                existing.add(ordinal)
+
+    def _candidates(self, query_lower: str) -> Optional[List[int]]:
+        """
+        Get concepts whose text contains every trigram of the query.
+
+        Every concept containing the query as a substring is among them.
+
+        Args:
+            query_lower: Lowercased search query
+
+        Returns:
+            Candidate node ordinals in graph order, or None if the query is
+            too short to use the index
+        """
+        if len(query_lower) < NGRAM:
+            return None
+
+        last = len(query_lower) - NGRAM + 1
+        grams = {query_lower[i : i + NGRAM] for i in range(last)}
+        postings: List[Set[int]] = []
+        for gram in grams:
+            gram_postings = self._trigrams.get(gram)
+            if not gram_postings:
+                return []
+            postings.append(gram_postings)
+
+        # Intersect starting from the rarest trigram
+        postings.sort(key=len)
+        return sorted(set(postings[0]).intersection(*postings[1:]))
 
     def find_by_label(self, label: str) -> Optional[str]:
         """
@@ -85,19 +406,19 @@ class GraphIndexer:
         Returns:
             Concept ID or None
         """
-        return self.label_index.get(label.lower())
+        return self.label_index.get(label.casefold())
 
-    def find_by_alt_label(self, alt_label: str) -> Optional[str]:
+    def find_by_alt_label(self, alt_label: str) -> List[str]:
         """
-        Find concept ID by alternative label.
+        Find concept IDs by alternative label.
 
         Args:
             alt_label: Alternative label (case-insensitive)
 
         Returns:
-            Concept ID or None
+            List of concept IDs sharing the label (empty if none)
         """
-        return self.alt_label_index.get(alt_label.lower())
+        return self.alt_label_index.get(alt_label.casefold(), [])
 
     def find_by_notation(self, notation: str) -> Optional[str]:
         """
@@ -113,7 +434,7 @@ class GraphIndexer:
 
     def get_related_concepts(
         self, concept_id: str, relation_type: str
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """
         Get related concepts by relation type.
 
@@ -122,17 +443,20 @@ class GraphIndexer:
             relation_type: Type of relation (broader, narrower, related, prerequisite)
 
         Returns:
-            List of related concept IDs
+            Tuple of related concept IDs
         """
         if relation_type not in self.relation_index:
-            return []
+            return ()
 
-        return self.relation_index[relation_type].get(concept_id, [])
+        return self.relation_index[relation_type].get(concept_id, ())
 
     def search_by_text(self, query: str, limit: int = 10) -> List[str]:
         """
         Search concepts by text in labels and definitions.
 
+        Only concepts sharing every trigram of the query are scored; queries
+        shorter than a trigram scan all concepts.
+
         Args:
             query: Search query (case-insensitive)
             limit: Maximum number of results
@@ -143,33 +467,101 @@ class GraphIndexer:
         query_lower = query.lower()
         matches: List[tuple[str, int]] = []  # (concept_id, score)
 
-        for node_id, node_data in self.graph.nodes(data=True):
+        indexed = self._candidates(query_lower)
+        candidates: Sequence[int] = (
+            range(len(self._node_ids)) if indexed is None else indexed
+        )
+
+        node_ids = self._node_ids
+        lc_pref = self._lc_pref
+        lc_alt = self._lc_alt
+        lc_def = self._lc_def
+        for i in candidates:
             score = 0
 
             # Check preferred label
-            pref_label = node_data.get("prefLabel", "").lower()
+            pref_label = lc_pref[i]
             if query_lower in pref_label:
                 score += 10
                 if pref_label == query_lower:
                     score += 20  # Exact match bonus
 
             # Check alt labels
-            alt_labels = node_data.get("altLabel", [])
-            for alt_label in alt_labels:
-                if query_lower in alt_label.lower():
+            for alt_label in lc_alt[i]:
+                if query_lower in alt_label:
                     score += 5
 
             # Check definition
-            definition = node_data.get("definition", "")
-            if definition and query_lower in definition.lower():
+            definition = lc_def[i]
+            if definition and query_lower in definition:
                 score += 3
 
             if score > 0:
-                matches.append((node_id, score))
+                matches.append((node_ids[i], score))
+
+        # Top results by score (descending); ties keep graph order
+        top = heapq.nlargest(limit, matches, key=itemgetter(1))
+        return [concept_id for concept_id, _ in top]
+
+    def update_concept(
+        self, old_concept: Optional[SKOSConcept], new_concept: SKOSConcept
+    ) -> None:
+        """
+        Patch the indexes for a single updated or added concept.
+
+        Call after KnowledgeGraphBuilder.update_concept(); relation entries
+        are patched the same way the builder patches the concept's edges.
+
+        Args:
+            old_concept: Concept as previously indexed (None if it is new)
+            new_concept: Updated concept
+        """
+        concept_id = new_concept.concept_id
+        self._relation_csr = None
+
+        if old_concept is not None:
+            self._unindex_labels(concept_id, old_concept)
+        self._index_labels(
+            concept_id,
+            new_concept.pref_label,
+            new_concept.alt_labels,
+            new_concept.notation,
+        )
+        self._index_text(
+            concept_id,
+            new_concept.pref_label,
+            new_concept.alt_labels,
+            new_concept.definition,
+        )
 
-        # Sort by score (descending) and return top results
-        matches.sort(key=lambda x: x[1], reverse=True)
-        return [concept_id for concept_id, _ in matches[:limit]]
+        # Drop every relation touching the concept. Other relation types are
+        # always stored in both directions, so only prerequisite sources
+        # pointing at the concept need a scan
+        relation_index = self.relation_index
+        neighbors: Set[str] = set()
+        for bucket in relation_index.values():
+            neighbors.update(bucket.pop(concept_id, ()))
+        prerequisite = relation_index.get("prerequisite", {})
+        neighbors.update(s for s, ids in prerequisite.items() if concept_id in ids)
+
+        for source in neighbors:
+            for bucket in relation_index.values():
+                ids = bucket.get(source)
+                if ids and concept_id in ids:
+                    remaining = tuple(i for i in ids if i != concept_id)
+                    if remaining:
+                        bucket[source] = remaining
+                    else:
+                        del bucket[source]
+
+        # Add the concept's relations, in the order the builder adds edges
+        edge_types: Dict[Tuple[str, str], str] = {}
+        collect_relations([new_concept], self.graph._node, edge_types)
+        for (source, target), relation_type in edge_types.items():
+            bucket = relation_index[relation_type]
+            bucket[source] = bucket.get(source, ()) + (target,)
+
+        self.logger.debug(f"Updated indexes for concept: {concept_id}")
 
     def rebuild_indexes(self) -> None:
         """Rebuild all indexes (call after graph updates)."""
@@ -177,4 +569,11 @@ class GraphIndexer:
         self.alt_label_index.clear()
         self.notation_index.clear()
         self.relation_index.clear()
+        self._node_ids.clear()
+        self._ordinals.clear()
+        self._trigrams.clear()
+        self._lc_pref.clear()
+        self._lc_alt.clear()
+        self._lc_def.clear()
+        self._relation_csr = None
         self._build_indexes()
@@ -1,11 +1,12 @@
 """Graph query engine for context expansion and search."""
 
 import logging
-from collections import deque
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import networkx as nx
 
+from ..extraction.skos_extractor import SKOSConcept
+from .csr import CSRAdjacency, bfs_levels
 from .indexer import GraphIndexer
 
 logger = logging.getLogger(__name__)
@@ -14,31 +15,53 @@ logger = logging.getLogger(__name__)
 class GraphQueryEngine:
     """Query engine for knowledge graph operations."""
 
-    def __init__(self, graph: nx.DiGraph, indexer: GraphIndexer) -> None:
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        indexer: GraphIndexer,
+        csr: Optional[CSRAdjacency] = None,
+        relations: Optional[Dict[str, CSRAdjacency]] = None,
+    ) -> None:
         """
         Initialize query engine.
 
         Args:
             graph: NetworkX graph
             indexer: Graph indexer for fast lookups
+            csr: Undirected CSR snapshot of the graph for path finding
+                (falls back to NetworkX if None, or for concepts it lacks
+                once the builder has cleared it)
+            relations: Per-relation-type CSR snapshot for context expansion
+                (falls back to the indexer's relation index if None)
         """
         self.graph = graph
         self.indexer = indexer
+        self._csr = csr
+        self._relations = relations
+        # Node payload mapping (concept_id -> {"obj": SKOSConcept}), bound once
+        self._nodes = graph._node
+        # Live undirected view (no copy) for the NetworkX path fallback
+        self._undirected = graph.to_undirected(as_view=True)
         self.logger = logging.getLogger(__name__)
 
-    def get_concept(self, concept_id: str) -> Optional[Dict]:
+    def get_concept(
+        self, concept_id: str, with_relations: bool = True
+    ) -> Optional[Dict]:
         """
         Get concept by ID.
 
         Args:
             concept_id: Concept ID
+            with_relations: Include the broader, narrower and related lists
 
         Returns:
-            Concept data or None
+            Concept data (a fresh dictionary the caller may modify) or None
         """
-        if self.graph.has_node(concept_id):
-            return dict(self.graph.nodes[concept_id])
-        return None
+        node = self._nodes.get(concept_id)
+        if node is None:
+            return None
+        concept: SKOSConcept = node["obj"]
+        return concept.to_dict(with_relations)
 
     def expand_context(
         self,
@@ -63,81 +86,213 @@ class GraphQueryEngine:
             relation_types = ["broader", "narrower", "related"]
 
         # Get focus concept
-        focus_concept = self.get_concept(concept_id)
-        if not focus_concept:
+        focus_data = self._nodes.get(concept_id)
+        if focus_data is None:
             return {"error": f"Concept '{concept_id}' not found"}
 
-        # BFS traversal to gather related concepts
-        visited: Set[str] = {concept_id}
+        if include_content:
+            return self._expand_context_withcontent(
+                concept_id, focus_data["obj"], relation_types, max_depth
+            )
+        return self._expand_context_nocontent(
+            concept_id, focus_data["obj"], relation_types, max_depth
+        )
+
+    def _expand_context_nocontent(
+        self,
+        concept_id: str,
+        focus_concept: SKOSConcept,
+        relation_types: List[str],
+        max_depth: int,
+    ) -> Dict:
+        """
+        Expand context without note content.
+
+        Args:
+            concept_id: Starting concept ID
+            focus_concept: Starting concept
+            relation_types: Types of relations to follow
+            max_depth: Maximum traversal depth
+
+        Returns:
+            Same as expand_context() with include_content=False
+        """
+        # Concepts are read from the node payload, never converted to dicts
+        nodes = self._nodes
+        direct_relations: Dict[str, List[Dict]] = {rt: [] for rt in relation_types}
+        transitive_relations: Dict[str, List[Dict]] = {rt: [] for rt in relation_types}
+
+        for related_id, depth, relation_type in self._traverse(
+            concept_id, relation_types, max_depth
+        ):
+            related_concept = nodes[related_id]["obj"]
+            relations = direct_relations if depth == 0 else transitive_relations
+            relations[relation_type].append({
+                "id": related_id,
+                "prefLabel": related_concept.pref_label,
+                "definition": related_concept.definition,
+            })
+
+        return {
+            "focus_concept": {
+                "id": concept_id,
+                "uri": focus_concept.uri,
+                "prefLabel": focus_concept.pref_label,
+                "definition": focus_concept.definition,
+                "file_path": str(focus_concept.file_path),
+            },
+            "direct_relations": direct_relations,
+            "transitive_relations": transitive_relations,
+        }
+
+    def _expand_context_withcontent(
+        self,
+        concept_id: str,
+        focus_concept: SKOSConcept,
+        relation_types: List[str],
+        max_depth: int,
+    ) -> Dict:
+        """
+        Expand context including the note content of every concept.
+
+        Args:
+            concept_id: Starting concept ID
+            focus_concept: Starting concept
+            relation_types: Types of relations to follow
+            max_depth: Maximum traversal depth
+
+        Returns:
+            Same as expand_context() with include_content=True
+        """
+        nodes = self._nodes
         direct_relations: Dict[str, List[Dict]] = {rt: [] for rt in relation_types}
         transitive_relations: Dict[str, List[Dict]] = {rt: [] for rt in relation_types}
         context_notes: List[Dict] = []
 
-        # Queue: (current_id, depth, relation_type)
-        queue: deque = deque([(concept_id, 0, None)])
-
-        while queue:
-            current_id, depth, from_relation = queue.popleft()
-
-            if depth >= max_depth:
-                continue
-
-            # Explore each relation type
-            for relation_type in relation_types:
-                related_ids = self.indexer.get_related_concepts(current_id, relation_type)
-
-                for related_id in related_ids:
-                    if related_id not in visited:
-                        visited.add(related_id)
-
-                        # Get related concept data
-                        related_concept = self.get_concept(related_id)
-                        if not related_concept:
-                            continue
-
-                        # Build concept summary
-                        concept_summary = {
-                            "id": related_id,
-                            "prefLabel": related_concept.get("prefLabel", ""),
-                            "definition": related_concept.get("definition"),
-                        }
-
-                        # Categorize as direct or transitive
-                        if depth == 0:
-                            direct_relations[relation_type].append(concept_summary)
-                        else:
-                            transitive_relations[relation_type].append(concept_summary)
-
-                        # Add to context notes if content requested
-                        if include_content:
-                            context_notes.append({
-                                "id": related_id,
-                                "label": related_concept.get("prefLabel", ""),
-                                "content": related_concept.get("content", ""),
-                                "file_path": related_concept.get("file_path", ""),
-                            })
-
-                        # Add to queue for further exploration
-                        queue.append((related_id, depth + 1, relation_type))
-
-        # Build response
-        response = {
+        for related_id, depth, relation_type in self._traverse(
+            concept_id, relation_types, max_depth
+        ):
+            related_concept = nodes[related_id]["obj"]
+            pref_label = related_concept.pref_label
+            relations = direct_relations if depth == 0 else transitive_relations
+            relations[relation_type].append({
+                "id": related_id,
+                "prefLabel": pref_label,
+                "definition": related_concept.definition,
+            })
+            context_notes.append({
+                "id": related_id,
+                "label": pref_label,
+                "content": related_concept.content,
+                "file_path": str(related_concept.file_path),
+            })
+
+        return {
             "focus_concept": {
                 "id": concept_id,
-                "uri": focus_concept.get("uri", ""),
-                "prefLabel": focus_concept.get("prefLabel", ""),
-                "definition": focus_concept.get("definition"),
-                "file_path": focus_concept.get("file_path", ""),
+                "uri": focus_concept.uri,
+                "prefLabel": focus_concept.pref_label,
+                "definition": focus_concept.definition,
+                "file_path": str(focus_concept.file_path),
+                "content": focus_concept.content,
             },
             "direct_relations": direct_relations,
             "transitive_relations": transitive_relations,
+            "context_notes": context_notes,
         }
 
-        if include_content:
-            response["focus_concept"]["content"] = focus_concept.get("content", "")
-            response["context_notes"] = context_notes
+    def _traverse(
+        self, concept_id: str, relation_types: List[str], max_depth: int
+    ) -> Iterator[Tuple[str, int, str]]:
+        """
+        Level-synchronous breadth-first traversal from a concept.
+
+        Each frontier is expanded node by node, relation type by relation
+        type, so concepts are discovered in the same order as a queue-based
+        BFS. Walks the builder's per-relation CSR snapshot, or the indexer's
+        CSR projection once the graph has been updated; unknown relation
+        types fall back to the indexer's relation index.
 
-        return response
+        Args:
+            concept_id: Starting concept ID
+            relation_types: Types of relations to follow
+            max_depth: Maximum traversal depth
+
+        Yields:
+            (concept_id, depth of the node it was reached from, relation type)
+            for each newly discovered concept
+        """
+        relations = self._relations or self.indexer.relation_csr()
+        if relation_types and all(rt in relations for rt in relation_types):
+            source = relations[relation_types[0]].index.get(concept_id)
+            if source is not None:
+                adjacency = [relations[rt] for rt in relation_types]
+                return self._traverse_csr(source, adjacency, relation_types, max_depth)
+        return self._traverse_ids(concept_id, relation_types, max_depth)
+
+    @staticmethod
+    def _traverse_csr(
+        source: int,
+        relations: List[CSRAdjacency],
+        relation_types: List[str],
+        max_depth: int,
+    ) -> Iterator[Tuple[str, int, str]]:
+        """
+        Traverse per-relation CSR arrays using integer node ids.
+
+        Args:
+            source: Integer id of the starting concept
+            relations: CSR adjacency per relation type (sharing node ids)
+            relation_types: Relation type names, parallel to relations
+            max_depth: Maximum traversal depth
+
+        Yields:
+            Same as _traverse()
+        """
+        node_ids = relations[0].nodes
+        reached, depths, kinds = bfs_levels(
+            [(csr.indptr, csr.indices) for csr in relations],
+            source,
+            len(node_ids),
+            max_depth,
+        )
+        for v, depth, kind in zip(reached, depths, kinds, strict=True):
+            yield node_ids[v], depth, relation_types[kind]
+
+    def _traverse_ids(
+        self, concept_id: str, relation_types: List[str], max_depth: int
+    ) -> Iterator[Tuple[str, int, str]]:
+        """
+        Traverse the indexer's relation index using concept IDs.
+
+        Args:
+            concept_id: Starting concept ID
+            relation_types: Types of relations to follow
+            max_depth: Maximum traversal depth
+
+        Yields:
+            Same as _traverse()
+        """
+        nodes = self._nodes
+        get_related = self.indexer.get_related_concepts
+
+        visited: Set[str] = {concept_id}
+        frontier = [concept_id]
+        for depth in range(max_depth):
+            next_frontier: List[str] = []
+            for current_id in frontier:
+                for relation_type in relation_types:
+                    for related_id in get_related(current_id, relation_type):
+                        if related_id not in visited:
+                            visited.add(related_id)
+                            # Stale index entry for a removed concept
+                            if related_id not in nodes:
+                                continue
+                            next_frontier.append(related_id)
+                            yield related_id, depth, relation_type
+            if not next_frontier:
+                break
+            frontier = next_frontier
 
     def search_concepts(self, query: str, limit: int = 10) -> Dict:
         """
@@ -153,16 +308,18 @@ class GraphQueryEngine:
         # Use indexer for text search
         matching_ids = self.indexer.search_by_text(query, limit)
 
+        nodes = self._nodes
         results = []
         for concept_id in matching_ids:
-            concept = self.get_concept(concept_id)
-            if concept:
+            node = nodes.get(concept_id)
+            if node is not None:
+                concept = node["obj"]
                 results.append({
                     "id": concept_id,
-                    "uri": concept.get("uri", ""),
-                    "prefLabel": concept.get("prefLabel", ""),
-                    "definition": concept.get("definition"),
-                    "file_path": concept.get("file_path", ""),
+                    "uri": concept.uri,
+                    "prefLabel": concept.pref_label,
+                    "definition": concept.definition,
+                    "file_path": str(concept.file_path),
                 })
 
         return {
@@ -184,27 +341,30 @@ class GraphQueryEngine:
         Returns:
             Dictionary with path information or None
         """
-        if not self.graph.has_node(from_concept):
+        if from_concept not in self._nodes:
             return {"error": f"Concept '{from_concept}' not found"}
 
-        if not self.graph.has_node(to_concept):
+        if to_concept not in self._nodes:
             return {"error": f"Concept '{to_concept}' not found"}
 
         try:
             # Find shortest path (undirected)
-            path = nx.shortest_path(
-                self.graph.to_undirected(), from_concept, to_concept
-            )
+            csr = self._csr
+            index = csr.index if csr is not None else {}
+            if csr is not None and from_concept in index and to_concept in index:
+                path = csr.shortest_path(from_concept, to_concept)
+                if path is None:
+                    raise nx.NetworkXNoPath
+            else:
+                path = nx.shortest_path(self._undirected, from_concept, to_concept)
 
             # Build path with concept details
-            path_concepts = []
-            for concept_id in path:
-                concept = self.get_concept(concept_id)
-                if concept:
-                    path_concepts.append({
-                        "id": concept_id,
-                        "prefLabel": concept.get("prefLabel", ""),
-                    })
+            nodes = self._nodes
+            path_concepts = [
+                {"id": concept_id, "prefLabel": nodes[concept_id]["obj"].pref_label}
+                for concept_id in path
+                if concept_id in nodes
+            ]
 
             return {
                 "from": from_concept,
@@ -228,7 +388,40 @@ class GraphQueryEngine:
         Returns:
             Dictionary with statistics
         """
+        # The builder clears the relation snapshot in place when the graph
+        # changes, so while it is populated it holds exactly one entry per edge
+        relations = self._relations
+        if relations:
+            total_relations = sum(len(r.indices) for r in relations.values())
+        else:
+            total_relations = self.graph.number_of_edges()
+
         return {
-            "total_concepts": self.graph.number_of_nodes(),
-            "total_relations": self.graph.number_of_edges(),
+            "total_concepts": len(self._nodes),
+            "total_relations": total_relations,
         }
+
+
+class LazyQueryEngine:
+    """
+    Stand-in for a GraphQueryEngine that is only built when first used.
+
+    Attribute access is delegated to the engine returned by the loader,
+    which is called on every access and must return quickly once built.
+    """
+
+    def __init__(self, loader: Callable[[], Optional[GraphQueryEngine]]) -> None:
+        """
+        Initialize lazy query engine.
+
+        Args:
+            loader: Builds the engine on first call (None if there is no graph)
+        """
+        self._loader = loader
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate to the query engine, building it first if needed."""
+        engine = self._loader()
+        if engine is None:
+            raise RuntimeError("Knowledge graph is not available: no concepts found")
+        return getattr(engine, name)
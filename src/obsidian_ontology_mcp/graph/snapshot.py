@@ -0,0 +1,168 @@
+"""On-disk snapshots of the built knowledge graph for fast restarts."""
+
+import contextlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from sys import intern
+from typing import Dict, List, Optional, Tuple, TypeVar
+
+import networkx as nx
+
+from ..extraction.skos_extractor import _intern_ids
+from .builder import KnowledgeGraphBuilder
+from .indexer import GraphIndexer
+
+logger = logging.getLogger(__name__)
+
+# Bump when the pickled builder or indexer layout changes
+SNAPSHOT_VERSION = 4
+SNAPSHOT_PREFIX = "graph_"
+SNAPSHOT_SUFFIX = ".pickle"
+
+V = TypeVar("V")
+
+
+def snapshot_path(cache_dir: Path, fingerprint: str) -> Path:
+    """
+    Get the snapshot file for a vault fingerprint.
+
+    Args:
+        cache_dir: Directory for on-disk caches
+        fingerprint: Vault fingerprint (see SKOSExtractor.fingerprint)
+
+    Returns:
+        Path of the snapshot file
+    """
+    return cache_dir / f"{SNAPSHOT_PREFIX}{fingerprint}{SNAPSHOT_SUFFIX}"
+
+
+def load_snapshot(
+    path: Path,
+) -> Optional[Tuple[KnowledgeGraphBuilder, GraphIndexer]]:
+    """
+    Load a graph snapshot.
+
+    Snapshots are pickles written by save_snapshot() into the server's own
+    cache directory, which must not be writable by untrusted users.
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        (graph builder, indexer) sharing one graph, or None if the snapshot
+        is missing or unusable
+    """
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            version, builder, indexer = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable graph snapshot {path}: {e}")
+        return None
+
+    if version != SNAPSHOT_VERSION:
+        return None
+    _intern_strings(builder, indexer)
+    return builder, indexer
+
+
+def _intern_list(values: List[str]) -> None:
+    """Intern the strings of a list in place."""
+    values[:] = [intern(value) for value in values]
+
+
+def _intern_keys(mapping: Dict[str, V]) -> None:
+    """Intern the keys of a dict in place, keeping their order."""
+    items = list(mapping.items())
+    mapping.clear()
+    mapping.update((intern(key), value) for key, value in items)
+
+
+def _intern_strings(builder: KnowledgeGraphBuilder, indexer: GraphIndexer) -> None:
+    """
+    Re-intern the concept IDs and index keys of a loaded snapshot.
+
+    Pickling keeps strings shared within a snapshot but does not intern
+    them, so like concepts from the parse cache they are passed through
+    sys.intern again. Containers shared between the builder, its CSR
+    snapshots and the indexer are updated in place to stay shared.
+
+    Args:
+        builder: Unpickled graph builder
+        indexer: Unpickled indexer over the same graph
+    """
+    # Rebuild the graph, since NetworkX keys its node and adjacency dicts
+    # by concept ID
+    old = builder.graph
+    graph = nx.DiGraph(**old.graph)
+    for concept_id, data in old._node.items():
+        _intern_ids(data["obj"])
+        graph.add_node(intern(concept_id), **data)
+    graph.add_edges_from(
+        (intern(source), intern(target), data)
+        for source, target, data in old.edges(data=True)
+    )
+    builder.graph = indexer.graph = graph
+
+    _intern_keys(builder.id_of)
+    snapshots = [builder.csr, *(builder.relations or {}).values()]
+    snapshots.extend((indexer._relation_csr or {}).values())
+    for csr in snapshots:
+        if csr is not None:
+            _intern_list(csr.nodes)
+            _intern_keys(csr.index)
+
+    indexer.label_index = {
+        intern(label): intern(concept_id)
+        for label, concept_id in indexer.label_index.items()
+    }
+    for concept_ids in indexer.alt_label_index.values():
+        _intern_list(concept_ids)
+    _intern_keys(indexer.alt_label_index)
+    indexer.notation_index = {
+        intern(notation): intern(concept_id)
+        for notation, concept_id in indexer.notation_index.items()
+    }
+    indexer.relation_index = {
+        relation_type: {
+            intern(source): tuple([intern(target) for target in targets])
+            for source, targets in bucket.items()
+        }
+        for relation_type, bucket in indexer.relation_index.items()
+    }
+    _intern_list(indexer._node_ids)
+    _intern_keys(indexer._ordinals)
+
+
+def save_snapshot(
+    path: Path, builder: KnowledgeGraphBuilder, indexer: GraphIndexer
+) -> None:
+    """
+    Atomically write a graph snapshot, replacing older ones.
+
+    Args:
+        path: Snapshot file
+        builder: Graph builder holding the graph and its CSR snapshots
+        indexer: Indexer over the same graph
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(
+                (SNAPSHOT_VERSION, builder, indexer), f, pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_file, path)
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning(f"Could not write graph snapshot {path}: {e}")
+        return
+
+    # Snapshots of earlier vault states are never read again
+    for old in path.parent.glob(f"{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}"):
+        if old != path:
+            with contextlib.suppress(OSError):
+                old.unlink()
@@ -0,0 +1,61 @@
+"""Queue-based logging, so callers never wait on log handler I/O."""
+
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The stock QueueHandler formats each record before queueing it, which
+    would render messages (and encode audit events) on the calling thread.
+    Only use it for loggers whose records carry no mutable arguments that
+    could change before the listener formats them, such as the audit logger.
+    Such a logger must not propagate to the root logger, whose stock
+    QueueHandler formats records on the calling thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Queue the record as is."""
+        return record
+
+
+def attach_queue_listener(
+    logger: logging.Logger, *handlers: logging.Handler, defer_formatting: bool = False
+) -> QueueListener:
+    """
+    Route a logger's records through a queue to handlers on a background thread.
+
+    Args:
+        logger: Logger to attach the queue handler to
+        *handlers: Handlers run by the listener thread
+        defer_formatting: Format records on the listener thread (see
+            DeferredQueueHandler) instead of before queueing them
+
+    Returns:
+        Started listener; stop() it to flush the queue on shutdown
+    """
+    queue: SimpleQueue = SimpleQueue()
+    listener = QueueListener(queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    handler_class = DeferredQueueHandler if defer_formatting else QueueHandler
+    logger.addHandler(handler_class(queue))
+    return listener
+
+
+class ReplayHandler(logging.Handler):
+    """
+    Handler passing records from worker processes to this process's loggers.
+
+    Run it from a QueueListener on the queue the workers' QueueHandlers
+    write to; each record is handled by the local logger of the same name.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Handle the record as if it had been logged here."""
+        logger = logging.getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
@@ -1,9 +1,16 @@
 """MCP tool definitions for knowledge graph operations."""
 
+import functools
+import inspect
 import logging
-import time
-from typing import Any, Dict, List, Optional
-
+import os
+import threading
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
 from fastmcp import FastMCP
 
 from ..graph.query import GraphQueryEngine
@@ -12,6 +19,70 @@ from ..security.validation import InputSanitizer
 
 logger = logging.getLogger(__name__)
 
+# Results of cached tools are reused for this long; clear_cache() drops them
+# when the graph is reloaded
+RESULT_CACHE_TTL = 300
+RESULT_CACHE_SIZE = 1024
+
+# Written to the cache directory when the server starts; see write_manifest()
+TOOL_MANIFEST_FILE = "tool_manifest.json"
+
+ToolFunction = Callable[..., Dict[str, Any]]
+
+
+class _Timed:
+    """Context manager timing a tool call with the monotonic ns clock."""
+
+    __slots__ = ("start_ns",)
+
+    def __enter__(self) -> "_Timed":
+        self.start_ns = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the block was entered."""
+        return (perf_counter_ns() - self.start_ns) / 1e6
+
+
+class _ToolError(Exception):
+    """Raised by a tool body to return a result that is audited as a failure."""
+
+    def __init__(self, error: str, result: Dict[str, Any]) -> None:
+        """
+        Initialize failure.
+
+        Args:
+            error: Error message for the audit log
+            result: Tool result returned to the client
+        """
+        super().__init__(error)
+        self.result = result
+
+
+def _audit_view(
+    keys: Tuple[str, ...], parameters: Tuple[str, ...]
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build the function selecting a tool's audited arguments.
+
+    When every argument is audited, the bound arguments dict (built fresh
+    per call) is logged as is instead of being copied.
+
+    Args:
+        keys: Audited argument names
+        parameters: All argument names of the tool, in order
+
+    Returns:
+        Function mapping the bound arguments to the audited ones
+    """
+    if keys == parameters:
+        return lambda arguments: arguments
+    return lambda arguments: {key: arguments[key] for key in keys}
+
 
 class MCPTools:
     """MCP tools for Obsidian ontology operations."""
@@ -21,6 +92,7 @@ class MCPTools:
         query_engine: GraphQueryEngine,
         sanitizer: InputSanitizer,
         audit_logger: AuditLogger,
+        manifest_path: Optional[Path] = None,
     ) -> None:
         """
         Initialize MCP tools.
@@ -29,12 +101,189 @@ class MCPTools:
             query_engine: Graph query engine
             sanitizer: Input sanitizer
             audit_logger: Audit logger
+            manifest_path: Tool manifest file served by describe_tools
+                (describe_tools reports an error if None)
         """
         self.query_engine = query_engine
         self.sanitizer = sanitizer
         self.audit_logger = audit_logger
+        self.manifest_path = manifest_path
         self.logger = logging.getLogger(__name__)
 
+        # (tool name, canonical JSON of the sanitized arguments) -> result
+        self._result_cache: TTLCache = TTLCache(
+            maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL
+        )
+        self._result_cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def clear_cache(self) -> None:
+        """Drop cached tool results, e.g. after the graph has been rebuilt."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Get result cache counters.
+
+        Returns:
+            Dictionary with hits, misses and current size
+        """
+        with self._result_cache_lock:
+            return {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "size": len(self._result_cache),
+            }
+
+    def _traced_tool(
+        self,
+        name: str,
+        sanitizers: Dict[str, Callable[[Any], Any]],
+        audited: Tuple[str, ...],
+        audited_on_error: Tuple[str, ...],
+        cached: bool = False,
+    ) -> Callable[[ToolFunction], ToolFunction]:
+        """
+        Wrap a tool body with input sanitization, timing and audit logging.
+
+        The wrapper keeps the body's signature, so FastMCP derives the same
+        tool schema from it.
+
+        Args:
+            name: Tool name for logs
+            sanitizers: Argument name -> sanitizer, applied in order
+            audited: Arguments recorded for successful calls
+            audited_on_error: Arguments recorded for failed calls
+            cached: Reuse successful results for identical sanitized
+                arguments (failures and error results are never cached)
+
+        Returns:
+            Decorator for the tool body
+        """
+
+        def decorator(fn: ToolFunction) -> ToolFunction:
+            signature = inspect.signature(fn)
+
+            parameters = tuple(signature.parameters)
+            success_args = _audit_view(audited, parameters)
+            failure_args = _audit_view(audited_on_error, parameters)
+
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = bound.arguments
+
+                with _Timed() as timer:
+                    try:
+                        # Sanitize inputs
+                        for key, sanitize in sanitizers.items():
+                            arguments[key] = sanitize(arguments[key])
+
+                        if cached:
+                            result, hit = self._cached_call(name, fn, arguments)
+                        else:
+                            result, hit = fn(**arguments), False
+
+                    except _ToolError as failure:
+                        self.audit_logger.log_tool_call(
+                            name,
+                            failure_args(arguments),
+                            success=False,
+                            execution_time_ms=timer.elapsed_ms,
+                            error=str(failure),
+                        )
+                        return failure.result
+
+                    except Exception as e:
+                        self.logger.error(f"Error in {name}: {e}")
+                        self.audit_logger.log_tool_call(
+                            name,
+                            failure_args(arguments),
+                            success=False,
+                            execution_time_ms=timer.elapsed_ms,
+                            error=str(e),
+                        )
+                        return {"error": str(e)}
+
+                    self.audit_logger.log_tool_call(
+                        name,
+                        success_args(arguments),
+                        success=True,
+                        execution_time_ms=timer.elapsed_ms,
+                        cached=hit,
+                    )
+                    return result
+
+            return wrapper
+
+        return decorator
+
+    def _cached_call(
+        self, name: str, fn: ToolFunction, arguments: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Call a tool body through the result cache.
+
+        Args:
+            name: Tool name
+            fn: Tool body
+            arguments: Sanitized arguments
+
+        Returns:
+            (result, whether it came from the cache)
+        """
+        key = (name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self.cache_hits += 1
+                return result, True
+            self.cache_misses += 1
+
+        result = fn(**arguments)
+        # Errors such as an unknown concept may not hold after a reload
+        if "error" not in result:
+            with self._result_cache_lock:
+                self._result_cache[key] = result
+        return result, False
+
+    async def write_manifest(self, mcp: FastMCP) -> None:
+        """
+        Write the names and input schemas of all registered tools to disk.
+
+        describe_tools serves this file as is, so clients can discover the
+        tools without the knowledge graph being built.
+
+        Args:
+            mcp: FastMCP server the tools are registered with
+        """
+        if self.manifest_path is None:
+            return
+
+        tools = await mcp.list_tools()
+        manifest = {
+            "tools": [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters,
+                }
+                for tool in tools
+            ]
+        }
+
+        path = self.manifest_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = path.with_suffix(".tmp")
+            tmp_file.write_bytes(orjson.dumps(manifest))
+            os.replace(tmp_file, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write tool manifest {path}: {e}")
+
     def register_tools(self, mcp: FastMCP) -> None:
         """
         Register all tools with FastMCP server.
@@ -42,8 +291,16 @@ class MCPTools:
         Args:
             mcp: FastMCP server instance
         """
+        sanitizer = self.sanitizer
 
         @mcp.tool()
+        @self._traced_tool(
+            "get_concept",
+            sanitizers={"concept_id": sanitizer.sanitize_concept_id},
+            audited=("concept_id", "include_relations"),
+            audited_on_error=("concept_id",),
+            cached=True,
+        )
         def get_concept(
             concept_id: str,
             include_relations: bool = True,
@@ -58,69 +315,43 @@ class MCPTools:
             Returns:
                 Concept data with optional relations
             """
-            start_time = time.time()
-
-            try:
-                # Sanitize input
-                concept_id = self.sanitizer.sanitize_concept_id(concept_id)
-
-                # Get concept
-                concept = self.query_engine.get_concept(concept_id)
-
-                if not concept:
-                    # Try finding by label
-                    found_id = self.query_engine.indexer.find_by_label(concept_id)
-                    if found_id:
-                        concept = self.query_engine.get_concept(found_id)
-
-                if not concept:
-                    execution_time = (time.time() - start_time) * 1000
-                    self.audit_logger.log_tool_call(
-                        "get_concept",
-                        {"concept_id": concept_id},
-                        success=False,
-                        execution_time_ms=execution_time,
-                        error="Concept not found",
+            # Get concept
+            concept = self.query_engine.get_concept(concept_id, include_relations)
+
+            if not concept:
+                # Try finding by label
+                found_id = self.query_engine.indexer.find_by_label(concept_id)
+                if found_id:
+                    concept = self.query_engine.get_concept(
+                        found_id, include_relations
                     )
-                    return {
+
+            if not concept:
+                raise _ToolError(
+                    "Concept not found",
+                    {
                         "error": f"Concept '{concept_id}' not found",
                         "available_count": self.query_engine.graph.number_of_nodes(),
-                    }
-
-                # Truncate content
-                if "content" in concept:
-                    concept["content"] = self.sanitizer.truncate_content(
-                        concept["content"]
-                    )
-
-                # Remove relations if not requested
-                if not include_relations:
-                    for rel in ["broader", "narrower", "related", "prerequisite"]:
-                        concept.pop(rel, None)
-
-                execution_time = (time.time() - start_time) * 1000
-                self.audit_logger.log_tool_call(
-                    "get_concept",
-                    {"concept_id": concept_id, "include_relations": include_relations},
-                    success=True,
-                    execution_time_ms=execution_time,
+                    },
                 )
 
-                return concept
-
-            except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
-                self.logger.error(f"Error in get_concept: {e}")
-                self.audit_logger.log_tool_call(
-                    "get_concept",
-                    {"concept_id": concept_id},
-                    success=False,
-                    execution_time_ms=execution_time,
-                    error=str(e),
-                )
-                return {"error": str(e)}
+            # Truncate content
+            if "content" in concept:
+                concept["content"] = sanitizer.truncate_content(concept["content"])
+
+            return concept
 
         @mcp.tool()
+        @self._traced_tool(
+            "expand_context",
+            sanitizers={
+                "concept_id": sanitizer.sanitize_concept_id,
+                "max_depth": sanitizer.validate_depth,
+            },
+            audited=("concept_id", "max_depth", "include_content"),
+            audited_on_error=("concept_id",),
+            cached=True,
+        )
         def expand_context(
             concept_id: str,
             relation_types: Optional[List[str]] = None,
@@ -142,59 +373,36 @@ class MCPTools:
             Returns:
                 Focus concept with all related concepts and their content
             """
-            start_time = time.time()
-
-            try:
-                # Sanitize inputs
-                concept_id = self.sanitizer.sanitize_concept_id(concept_id)
-                max_depth = self.sanitizer.validate_depth(max_depth)
-
-                if relation_types is None:
-                    relation_types = ["broader", "narrower", "related"]
-
-                # Expand context
-                result = self.query_engine.expand_context(
-                    concept_id=concept_id,
-                    relation_types=relation_types,
-                    max_depth=max_depth,
-                    include_content=include_content,
-                )
+            if relation_types is None:
+                relation_types = ["broader", "narrower", "related"]
 
-                # Truncate content in results
-                if include_content and "context_notes" in result:
-                    for note in result["context_notes"]:
-                        if "content" in note:
-                            note["content"] = self.sanitizer.truncate_content(
-                                note["content"]
-                            )
-
-                execution_time = (time.time() - start_time) * 1000
-                self.audit_logger.log_tool_call(
-                    "expand_context",
-                    {
-                        "concept_id": concept_id,
-                        "max_depth": max_depth,
-                        "include_content": include_content,
-                    },
-                    success=True,
-                    execution_time_ms=execution_time,
-                )
+            # Expand context
+            result = self.query_engine.expand_context(
+                concept_id=concept_id,
+                relation_types=relation_types,
+                max_depth=max_depth,
+                include_content=include_content,
+            )
 
-                return result
-
-            except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
-                self.logger.error(f"Error in expand_context: {e}")
-                self.audit_logger.log_tool_call(
-                    "expand_context",
-                    {"concept_id": concept_id},
-                    success=False,
-                    execution_time_ms=execution_time,
-                    error=str(e),
-                )
-                return {"error": str(e)}
+            # Truncate content in results
+            if include_content and "context_notes" in result:
+                for note in result["context_notes"]:
+                    if "content" in note:
+                        note["content"] = sanitizer.truncate_content(note["content"])
+
+            return result
 
         @mcp.tool()
+        @self._traced_tool(
+            "search_concepts",
+            sanitizers={
+                "query": sanitizer.sanitize_query,
+                "limit": sanitizer.validate_limit,
+            },
+            audited=("query", "limit"),
+            audited_on_error=("query",),
+            cached=True,
+        )
         def search_concepts(
             query: str,
             limit: int = 10,
@@ -209,39 +417,19 @@ class MCPTools:
             Returns:
                 List of matching concepts
             """
-            start_time = time.time()
-
-            try:
-                # Sanitize inputs
-                query = self.sanitizer.sanitize_query(query)
-                limit = self.sanitizer.validate_limit(limit)
-
-                # Search
-                result = self.query_engine.search_concepts(query, limit)
-
-                execution_time = (time.time() - start_time) * 1000
-                self.audit_logger.log_tool_call(
-                    "search_concepts",
-                    {"query": query, "limit": limit},
-                    success=True,
-                    execution_time_ms=execution_time,
-                )
-
-                return result
-
-            except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
-                self.logger.error(f"Error in search_concepts: {e}")
-                self.audit_logger.log_tool_call(
-                    "search_concepts",
-                    {"query": query},
-                    success=False,
-                    execution_time_ms=execution_time,
-                    error=str(e),
-                )
-                return {"error": str(e)}
+            return self.query_engine.search_concepts(query, limit)
 
         @mcp.tool()
+        @self._traced_tool(
+            "get_concept_path",
+            sanitizers={
+                "from_concept": sanitizer.sanitize_concept_id,
+                "to_concept": sanitizer.sanitize_concept_id,
+            },
+            audited=("from_concept", "to_concept"),
+            audited_on_error=("from_concept", "to_concept"),
+            cached=True,
+        )
         def get_concept_path(
             from_concept: str,
             to_concept: str,
@@ -256,39 +444,15 @@ class MCPTools:
             Returns:
                 Path information with intermediate concepts
             """
-            start_time = time.time()
-
-            try:
-                # Sanitize inputs
-                from_concept = self.sanitizer.sanitize_concept_id(from_concept)
-                to_concept = self.sanitizer.sanitize_concept_id(to_concept)
-
-                # Find path
-                result = self.query_engine.get_concept_path(from_concept, to_concept)
-
-                execution_time = (time.time() - start_time) * 1000
-                self.audit_logger.log_tool_call(
-                    "get_concept_path",
-                    {"from_concept": from_concept, "to_concept": to_concept},
-                    success=True,
-                    execution_time_ms=execution_time,
-                )
-
-                return result
-
-            except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
-                self.logger.error(f"Error in get_concept_path: {e}")
-                self.audit_logger.log_tool_call(
-                    "get_concept_path",
-                    {"from_concept": from_concept, "to_concept": to_concept},
-                    success=False,
-                    execution_time_ms=execution_time,
-                    error=str(e),
-                )
-                return {"error": str(e)}
+            return self.query_engine.get_concept_path(from_concept, to_concept)
 
         @mcp.tool()
+        @self._traced_tool(
+            "get_statistics",
+            sanitizers={},
+            audited=(),
+            audited_on_error=(),
+        )
         def get_statistics() -> Dict[str, Any]:
             """
             Get knowledge graph statistics.
@@ -296,33 +460,35 @@ class MCPTools:
             Returns:
                 Graph metrics and server information
             """
-            start_time = time.time()
+            from ..config import get_settings
 
-            try:
-                from ..config import settings
+            stats = self.query_engine.get_statistics()
+            settings = get_settings()
+            stats["vault_path"] = str(settings.vault_path)
+            stats["server_version"] = settings.mcp_server_version
 
-                stats = self.query_engine.get_statistics()
-                stats["vault_path"] = str(settings.vault_path)
-                stats["server_version"] = settings.mcp_server_version
+            return stats
 
-                execution_time = (time.time() - start_time) * 1000
-                self.audit_logger.log_tool_call(
-                    "get_statistics",
-                    {},
-                    success=True,
-                    execution_time_ms=execution_time,
-                )
+        @mcp.tool()
+        @self._traced_tool(
+            "describe_tools",
+            sanitizers={},
+            audited=(),
+            audited_on_error=(),
+        )
+        def describe_tools() -> Dict[str, Any]:
+            """
+            List the available tools and their input schemas.
 
-                return stats
-
-            except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
-                self.logger.error(f"Error in get_statistics: {e}")
-                self.audit_logger.log_tool_call(
-                    "get_statistics",
-                    {},
-                    success=False,
-                    execution_time_ms=execution_time,
-                    error=str(e),
+            Returns:
+                Tool manifest (does not access the knowledge graph)
+            """
+            path = self.manifest_path
+            if path is None or not path.exists():
+                raise _ToolError(
+                    "Tool manifest not available",
+                    {"error": "Tool manifest not available"},
                 )
-                return {"error": str(e)}
+
+            manifest: Dict[str, Any] = orjson.loads(path.read_bytes())
+            return manifest
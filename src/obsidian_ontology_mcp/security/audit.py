@@ -1,12 +1,55 @@
 """Audit logging for security events and API calls."""
 
-import json
+import atexit
 import logging
-from datetime import datetime
+import time
+from logging.handlers import QueueListener
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from ..config import settings
+import orjson
+
+from ..config import get_settings
+from ..log_queue import attach_queue_listener
+
+
+class _AuditEvent:
+    """Audit event that is JSON-encoded only when a handler formats it."""
+
+    __slots__ = ("event", "_text")
+
+    def __init__(self, event: Dict[str, Any]) -> None:
+        """
+        Initialize event.
+
+        Args:
+            event: Event dictionary (not modified afterwards)
+        """
+        self.event = event
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        """
+        Encode the event as a JSON line (once).
+
+        This runs on the listener thread, where an exception would only be
+        reported by the handler and the event lost. Values JSON cannot hold
+        are therefore written as strings, and details that still fail to
+        encode are replaced by their repr().
+        """
+        if self._text is None:
+            try:
+                data = orjson.dumps(self.event, default=str)
+            except orjson.JSONEncodeError as e:
+                data = orjson.dumps(
+                    {
+                        **self.event,
+                        "details": repr(self.event.get("details")),
+                        "encoding_error": str(e),
+                    }
+                )
+            self._text = data.decode()
+        return self._text
 
 
 class AuditLogger:
@@ -19,29 +62,50 @@ class AuditLogger:
         Args:
             log_file: Path to audit log file
         """
-        self.log_file = log_file or settings.audit_log_file
+        self.log_file = log_file or get_settings().audit_log_file
         self.logger = logging.getLogger("audit")
 
+        # (epoch second, its "YYYY-MM-DDTHH:MM:SS" UTC form) of the last event
+        self._second: Tuple[int, str] = (-1, "")
+
         # Configure file handler for audit log
         self._setup_file_handler()
 
     def _setup_file_handler(self) -> None:
-        """Set up file handler for audit logging."""
+        """
+        Set up file handler for audit logging.
+
+        Events are handed to a queue and written by a background listener
+        thread, so tool calls never wait on file I/O.
+        """
         # Ensure log directory exists
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Create file handler
-        handler = logging.FileHandler(self.log_file)
+        handler = logging.FileHandler(self.log_file, encoding="utf-8")
         handler.setLevel(logging.INFO)
 
         # JSON formatter
         formatter = logging.Formatter('%(message)s')
         handler.setFormatter(formatter)
 
-        # Add handler to logger
-        self.logger.addHandler(handler)
+        # Encode and write from a background thread; the queue is drained on exit
+        self._listener: Optional[QueueListener] = attach_queue_listener(
+            self.logger, handler, defer_formatting=True
+        )
+        atexit.register(self.close)
         self.logger.setLevel(logging.INFO)
 
+        # Root handlers would format (and so encode) every event on the
+        # calling thread, and audit events belong in the audit log only
+        self.logger.propagate = False
+
+    def close(self) -> None:
+        """Write out queued events and stop the background writer."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+
     def _log_event(self, event_type: str, details: Dict[str, Any]) -> None:
         """
         Log an audit event.
@@ -50,13 +114,35 @@ class AuditLogger:
             event_type: Type of event
             details: Event details
         """
+        # Skip the timestamp and encoding when audit logging is turned off
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         event = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(),
             "event_type": event_type,
             "details": details,
         }
 
-        self.logger.info(json.dumps(event))
+        self.logger.info(_AuditEvent(event))
+
+    def _timestamp(self) -> str:
+        """
+        Format the current UTC time like ``datetime.utcnow().isoformat()``.
+
+        The seconds part is formatted once per second and reused; only the
+        microseconds are formatted per event.
+
+        Returns:
+            ISO 8601 timestamp with microseconds
+        """
+        ns = time.time_ns()
+        sec, micros = divmod(ns // 1000, 1_000_000)
+        last_sec, prefix = self._second
+        if sec != last_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._second = (sec, prefix)
+        return f"{prefix}.{micros:06d}"
 
     def log_authentication(
         self,
@@ -92,6 +178,7 @@ class AuditLogger:
         success: bool = True,
         execution_time_ms: Optional[float] = None,
         error: Optional[str] = None,
+        cached: bool = False,
     ) -> None:
         """
         Log MCP tool execution.
@@ -103,6 +190,7 @@ class AuditLogger:
             success: Whether execution succeeded
             execution_time_ms: Execution time in milliseconds
             error: Error message if failed
+            cached: Whether the result came from the tool result cache
         """
         self._log_event(
             "tool_call",
@@ -113,6 +201,7 @@ class AuditLogger:
                 "success": success,
                 "execution_time_ms": execution_time_ms,
                 "error": error,
+                "cached": cached,
             },
         )
 
@@ -1,19 +1,36 @@
 """JWT authentication and password management."""
 
+import hashlib
 import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import TTLCache
 from passlib.context import CryptContext
-from pydantic import BaseModel
 
-from ..config import settings
+from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Verified tokens are remembered for this long (bounded by their own expiry)
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_SIZE = 4096
 
-class Token(BaseModel):
+# Password checks are remembered briefly, so repeated logins and repeated
+# bad-password probes skip the deliberately slow hash
+AUTH_CACHE_TTL = 30
+AUTH_CACHE_SIZE = 1024
+
+
+# Plain dataclasses: the token fields are produced or validated here, so
+# they need no model validation; dataclasses.asdict() gives the response body
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Token:
     """JWT token response model."""
 
     access_token: str
@@ -21,27 +38,46 @@ class Token(BaseModel):
     expires_in: int
 
 
-class TokenData(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TokenData:
     """Token payload data."""
 
     username: Optional[str] = None
 
 
 class AuthManager:
-    """Manages authentication with JWT tokens and bcrypt passwords."""
+    """Manages authentication with JWT tokens and argon2/bcrypt passwords."""
 
     def __init__(self) -> None:
         """Initialize authentication manager."""
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        # New hashes use argon2id; existing bcrypt hashes still verify
+        self.pwd_context = CryptContext(
+            schemes=["argon2", "bcrypt"],
+            deprecated="auto",
+            argon2__parallelism=4,
+        )
         self.logger = logging.getLogger(__name__)
 
+        # (username, keyed password digest) -> authentication result
+        self._auth_cache: TTLCache[Tuple[str, bytes], bool] = TTLCache(
+            maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL
+        )
+        self._auth_cache_key = os.urandom(32)
+        self._auth_cache_lock = threading.Lock()
+
+        # token -> (TokenData or None if invalid, timestamp until which it holds)
+        self._token_cache: TTLCache[str, Tuple[Optional[TokenData], float]] = TTLCache(
+            maxsize=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL
+        )
+        self._token_cache_lock = threading.Lock()
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verify a password against its hash.
 
         Args:
             plain_password: Plain text password
-            hashed_password: Bcrypt hash
+            hashed_password: Argon2 or bcrypt hash
 
         Returns:
             True if password matches
@@ -54,13 +90,13 @@ class AuthManager:
 
     def hash_password(self, password: str) -> str:
         """
-        Hash a password with bcrypt.
+        Hash a password with argon2id.
 
         Args:
             password: Plain text password
 
         Returns:
-            Bcrypt hash
+            Argon2 hash
         """
         return self.pwd_context.hash(password)
 
@@ -75,12 +111,28 @@ class AuthManager:
         Returns:
             True if authentication successful
         """
+        security = get_settings().security
+
         # Check username
-        if username != settings.security.admin_username:
+        if username != security.admin_username:
             return False
 
-        # Verify password
-        return self.verify_password(password, settings.security.admin_password_hash)
+        # Verify password, reusing a recent result for the same password.
+        # The cache key is a digest keyed with a per-process secret, so the
+        # cache never holds anything usable as a password hash
+        digest = hashlib.blake2b(
+            password.encode(), key=self._auth_cache_key, digest_size=32
+        ).digest()
+        key = (username, digest)
+        with self._auth_cache_lock:
+            cached = self._auth_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self.verify_password(password, security.admin_password_hash)
+        with self._auth_cache_lock:
+            self._auth_cache[key] = result
+        return result
 
     def create_access_token(
         self, data: dict, expires_delta: Optional[timedelta] = None
@@ -95,21 +147,22 @@ class AuthManager:
         Returns:
             JWT token string
         """
+        security = get_settings().security
         to_encode = data.copy()
 
         if expires_delta:
             expire = datetime.utcnow() + expires_delta
         else:
             expire = datetime.utcnow() + timedelta(
-                minutes=settings.security.jwt_access_token_expire_minutes
+                minutes=security.jwt_access_token_expire_minutes
             )
 
         to_encode.update({"exp": expire})
 
         encoded_jwt = jwt.encode(
             to_encode,
-            settings.security.jwt_secret_key,
-            algorithm=settings.security.jwt_algorithm,
+            security.jwt_secret_key,
+            algorithm=security.jwt_algorithm,
         )
 
         return encoded_jwt
@@ -118,28 +171,64 @@ class AuthManager:
         """
         Verify and decode a JWT token.
 
+        Results are cached per token string for a short time, so repeated
+        requests with the same token skip signature verification. Invalid
+        tokens never become valid, so failures are cached too, except that
+        a token used too early is only cached until it becomes valid.
+
         Args:
             token: JWT token string
 
         Returns:
             TokenData or None if invalid
         """
+        with self._token_cache_lock:
+            cached = self._token_cache.get(token)
+        if cached is not None:
+            token_data, expires_at = cached
+            if time.time() < expires_at:
+                return token_data
+
+        result = self._decode_token(token)
+        with self._token_cache_lock:
+            self._token_cache[token] = result
+        return result[0]
+
+    def _decode_token(self, token: str) -> Tuple[Optional[TokenData], float]:
+        """
+        Verify a JWT token's signature and claims.
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            (TokenData or None if invalid, timestamp until which the result
+            holds)
+        """
+        security = get_settings().security
         try:
             payload = jwt.decode(
                 token,
-                settings.security.jwt_secret_key,
-                algorithms=[settings.security.jwt_algorithm],
+                security.jwt_secret_key,
+                algorithms=[security.jwt_algorithm],
             )
 
-            username: str = payload.get("sub")
+            username: Optional[str] = payload.get("sub")
             if username is None:
-                return None
+                return None, float("inf")
 
-            return TokenData(username=username)
+            return TokenData(username=username), payload.get("exp", float("inf"))
+
+        except jwt.ImmatureSignatureError as e:
+            # Signed but not valid yet (nbf or iat in the future): the
+            # failure only holds until then
+            self.logger.warning(f"JWT verification failed: {e}")
+            claims = jwt.decode(token, options={"verify_signature": False})
+            return None, max(claims.get("nbf", 0.0), claims.get("iat", 0.0))
 
-        except JWTError as e:
+        except jwt.InvalidTokenError as e:
             self.logger.warning(f"JWT verification failed: {e}")
-            return None
+            return None, float("inf")
 
     def create_token_for_user(self, username: str) -> Token:
         """
@@ -156,5 +245,5 @@ class AuthManager:
         return Token(
             access_token=access_token,
             token_type="bearer",
-            expires_in=settings.security.jwt_access_token_expire_minutes * 60,
+            expires_in=get_settings().security.jwt_access_token_expire_minutes * 60,
         )
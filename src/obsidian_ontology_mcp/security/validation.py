@@ -2,9 +2,9 @@
 
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
-from ..config import settings
+from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -31,18 +31,38 @@ class InputSanitizer:
         r"\/proc\/",
     ]
 
+    # Characters allowed in concept IDs (checked with fullmatch)
+    CONCEPT_ID_RE = re.compile(r"[a-zA-Z0-9_-]+")
+
+    # Appended to content cut at max_concept_content_length
+    TRUNCATION_SUFFIX = "\n[... content truncated ...]"
+
+    # Joins list items for a single injection scan; no pattern can match it,
+    # so a match never spans two items
+    LIST_ITEM_SEPARATOR = "\x01"
+
     def __init__(self) -> None:
         """Initialize sanitizer."""
         self.logger = logging.getLogger(__name__)
-        self.compiled_patterns = {
-            "prompt_injection": [
-                re.compile(pattern, re.IGNORECASE)
-                for pattern in self.PROMPT_INJECTION_PATTERNS
-            ],
-            "path_traversal": [
-                re.compile(pattern, re.IGNORECASE)
-                for pattern in self.PATH_TRAVERSAL_PATTERNS
-            ],
+
+        # Each pattern list is fused into one alternation, so a single
+        # search() scans the input once
+        self.prompt_injection_re = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.PROMPT_INJECTION_PATTERNS),
+            re.IGNORECASE,
+        )
+        self.path_traversal_re = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.PATH_TRAVERSAL_PATTERNS),
+            re.IGNORECASE,
+        )
+
+        # Exact argument type -> sanitizer, replacing an isinstance() chain
+        # (bool is listed since it was handled as an int)
+        self._argument_sanitizers: Dict[type, Callable[[str, Any], Any]] = {
+            str: self._sanitize_str_argument,
+            int: self._sanitize_int_argument,
+            bool: self._sanitize_int_argument,
+            list: self._sanitize_list_argument,
         }
 
     def sanitize_query(self, query: str) -> str:
@@ -59,24 +79,48 @@ class InputSanitizer:
             ValueError: If query contains malicious patterns
         """
         # Check length
-        if len(query) > settings.security.max_query_length:
-            raise ValueError(
-                f"Query too long (max {settings.security.max_query_length} characters)"
-            )
+        max_length = get_settings().security.max_query_length
+        if len(query) > max_length:
+            raise ValueError(f"Query too long (max {max_length} characters)")
 
         # Check for prompt injection
-        for pattern in self.compiled_patterns["prompt_injection"]:
-            if pattern.search(query):
-                self.logger.warning(f"Prompt injection attempt detected: {query[:50]}")
-                raise ValueError("Query contains potentially malicious content")
+        if self._has_prompt_injection(query):
+            self.logger.warning(f"Prompt injection attempt detected: {query[:50]}")
+            raise ValueError("Query contains potentially malicious content")
+
+        return self._strip_query(query)
+
+    def _has_prompt_injection(self, text: str) -> bool:
+        """
+        Check text for prompt injection patterns, ignoring case.
+
+        Matched with re.IGNORECASE on the original text: casefolding does
+        not cover every case equivalence (e.g. "İ" folds to "i̇", not "i").
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            True if any prompt injection pattern matches
+        """
+        return self.prompt_injection_re.search(text) is not None
 
+    @staticmethod
+    def _strip_query(query: str) -> str:
+        """
+        Strip HTML tags and surrounding whitespace from a checked query.
+
+        Args:
+            query: Query that passed the length and injection checks
+
+        Returns:
+            Cleaned query
+        """
         # Strip HTML tags
         query = re.sub(r"<[^>]+>", "", query)
 
         # Trim whitespace
-        query = query.strip()
-
-        return query
+        return query.strip()
 
     def sanitize_concept_id(self, concept_id: str) -> str:
         """
@@ -91,17 +135,17 @@ class InputSanitizer:
         Raises:
             ValueError: If concept ID is invalid
         """
-        # Check for path traversal
-        for pattern in self.compiled_patterns["path_traversal"]:
-            if pattern.search(concept_id):
-                self.logger.warning(f"Path traversal attempt: {concept_id}")
-                raise ValueError("Invalid concept ID")
+        # Allow only alphanumeric, underscore, hyphen. Every path traversal
+        # pattern needs a ".", "~" or "/", so valid IDs skip that scan
+        if self.CONCEPT_ID_RE.fullmatch(concept_id):
+            return concept_id.lower()
 
-        # Allow only alphanumeric, underscore, hyphen
-        if not re.match(r"^[a-zA-Z0-9_-]+$", concept_id):
-            raise ValueError("Concept ID contains invalid characters")
+        # Check for path traversal
+        if self.path_traversal_re.search(concept_id):
+            self.logger.warning(f"Path traversal attempt: {concept_id}")
+            raise ValueError("Invalid concept ID")
 
-        return concept_id.lower()
+        raise ValueError("Concept ID contains invalid characters")
 
     def validate_depth(self, depth: int) -> int:
         """
@@ -119,9 +163,10 @@ class InputSanitizer:
         if depth < 0:
             raise ValueError("Depth must be non-negative")
 
-        if depth > settings.security.max_context_depth:
-            self.logger.warning(f"Depth {depth} exceeds maximum, capping to {settings.security.max_context_depth}")
-            depth = settings.security.max_context_depth
+        max_depth = get_settings().security.max_context_depth
+        if depth > max_depth:
+            self.logger.warning(f"Depth {depth} exceeds maximum, capping to {max_depth}")
+            depth = max_depth
 
         return depth
 
@@ -141,9 +186,10 @@ class InputSanitizer:
         if limit < 1:
             raise ValueError("Limit must be positive")
 
-        if limit > settings.security.max_results_per_query:
-            self.logger.warning(f"Limit {limit} exceeds maximum, capping to {settings.security.max_results_per_query}")
-            limit = settings.security.max_results_per_query
+        max_limit = get_settings().security.max_results_per_query
+        if limit > max_limit:
+            self.logger.warning(f"Limit {limit} exceeds maximum, capping to {max_limit}")
+            limit = max_limit
 
         return limit
 
@@ -157,11 +203,11 @@ class InputSanitizer:
         Returns:
             Truncated content
         """
-        max_length = settings.security.max_concept_content_length
+        max_length = get_settings().security.max_concept_content_length
 
         if len(content) > max_length:
             self.logger.debug(f"Truncating content from {len(content)} to {max_length} characters")
-            return content[:max_length] + "\n[... content truncated ...]"
+            return "".join((content[:max_length], self.TRUNCATION_SUFFIX))
 
         return content
 
@@ -179,35 +225,49 @@ class InputSanitizer:
             ValueError: If arguments contain malicious content
         """
         sanitized = {}
+        handlers = self._argument_sanitizers
 
         for key, value in arguments.items():
-            if isinstance(value, str):
-                # Sanitize string values
-                if key in ["query", "concept_id", "from_concept", "to_concept"]:
-                    if key == "query":
-                        sanitized[key] = self.sanitize_query(value)
-                    else:
-                        sanitized[key] = self.sanitize_concept_id(value)
-                else:
-                    sanitized[key] = value
-
-            elif isinstance(value, int):
-                # Validate numeric values
-                if key in ["max_depth", "depth"]:
-                    sanitized[key] = self.validate_depth(value)
-                elif key == "limit":
-                    sanitized[key] = self.validate_limit(value)
-                else:
-                    sanitized[key] = value
-
-            elif isinstance(value, list):
-                # Sanitize list values
-                sanitized[key] = [
-                    self.sanitize_query(item) if isinstance(item, str) else item
-                    for item in value
-                ]
-
-            else:
-                sanitized[key] = value
+            handler = handlers.get(type(value))
+            sanitized[key] = handler(key, value) if handler else value
 
         return sanitized
+
+    def _sanitize_str_argument(self, key: str, value: str) -> str:
+        """Sanitize a string tool argument by name."""
+        if key == "query":
+            return self.sanitize_query(value)
+        if key in ("concept_id", "from_concept", "to_concept"):
+            return self.sanitize_concept_id(value)
+        return value
+
+    def _sanitize_int_argument(self, key: str, value: int) -> int:
+        """Validate a numeric tool argument by name."""
+        if key in ("max_depth", "depth"):
+            return self.validate_depth(value)
+        if key == "limit":
+            return self.validate_limit(value)
+        return value
+
+    def _sanitize_list_argument(self, key: str, value: List[Any]) -> List[Any]:
+        """
+        Sanitize every string item of a list tool argument as a query.
+
+        The items are scanned for prompt injection in a single pass over
+        their joined text; only when that finds something are they checked
+        one by one, which raises the same error as sanitize_query().
+        """
+        items = [item for item in value if isinstance(item, str)]
+        max_length = get_settings().security.max_query_length
+        if any(len(item) > max_length for item in items) or (
+            self._has_prompt_injection(self.LIST_ITEM_SEPARATOR.join(items))
+        ):
+            return [
+                self.sanitize_query(item) if isinstance(item, str) else item
+                for item in value
+            ]
+
+        return [
+            self._strip_query(item) if isinstance(item, str) else item
+            for item in value
+        ]
@@ -1,17 +1,25 @@
 """Main MCP server orchestration."""
 
+import atexit
 import logging
+import os
+import threading
+from importlib.util import find_spec
+from logging.handlers import QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+import anyio
 from fastmcp import FastMCP
 
-from .config import settings
+from .config import get_settings
 from .extraction.skos_extractor import SKOSExtractor
 from .graph.builder import KnowledgeGraphBuilder
 from .graph.indexer import GraphIndexer
-from .graph.query import GraphQueryEngine
-from .mcp.tools import MCPTools
+from .graph.query import GraphQueryEngine, LazyQueryEngine
+from .graph.snapshot import load_snapshot, save_snapshot, snapshot_path
+from .log_queue import attach_queue_listener
+from .mcp.tools import TOOL_MANIFEST_FILE, MCPTools
 from .security.audit import AuditLogger
 from .security.validation import InputSanitizer
 
@@ -28,94 +36,206 @@ class OntologyMCPServer:
         Args:
             vault_path: Path to Obsidian vault (defaults to settings)
         """
-        self.vault_path = vault_path or settings.vault_path
-        self.logger = logging.getLogger(__name__)
+        self.settings = get_settings()
+        self.vault_path = vault_path or self.settings.vault_path
 
         # Configure logging
         self._setup_logging()
 
         # Initialize components
-        self.logger.info("Initializing Obsidian Ontology MCP Server...")
+        logger.info("Initializing Obsidian Ontology MCP Server...")
 
         # Security
         self.sanitizer = InputSanitizer()
         self.audit_logger = AuditLogger()
 
         # Extraction
-        self.extractor = SKOSExtractor(self.vault_path)
+        self.extractor = SKOSExtractor(
+            self.vault_path,
+            cache_dir=(
+                self.settings.cache_dir if self.settings.graph_cache_enabled else None
+            ),
+            max_workers=self.settings.extraction_workers or None,
+        )
 
-        # Graph
+        # Graph (built on first use, or in the background once run() starts)
         self.graph_builder = KnowledgeGraphBuilder()
         self.indexer: Optional[GraphIndexer] = None
         self.query_engine: Optional[GraphQueryEngine] = None
+        self._graph_lock = threading.Lock()
+        self._graph_ready = threading.Event()
+        self._vault_fingerprint: Optional[str] = None  # Vault the graph was built from
 
         # MCP
-        self.mcp = FastMCP(settings.mcp_server_name)
+        self.mcp = FastMCP(self.settings.mcp_server_name)
         self.mcp_tools: Optional[MCPTools] = None
 
-        # Build graph on initialization
-        self._build_graph()
-
         # Register tools
         self._register_tools()
 
-        self.logger.info("Server initialized successfully")
+        logger.info("Server initialized successfully")
 
     def _setup_logging(self) -> None:
-        """Configure logging."""
-        logging.basicConfig(
-            level=getattr(logging, settings.log_level),
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.FileHandler(settings.log_file),
-                logging.StreamHandler(),
-            ],
+        """
+        Configure logging.
+
+        Like logging.basicConfig(), does nothing if the root logger already
+        has handlers. The file and stderr handlers run on a background
+        thread, so logging never blocks extraction or tool calls.
+        """
+        self._log_listener: Optional[QueueListener] = None
+        root = logging.getLogger()
+        if root.handlers:
+            return
+
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
+        handlers: List[logging.Handler] = [
+            logging.FileHandler(self.settings.log_file),
+            logging.StreamHandler(),
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        root.setLevel(getattr(logging, self.settings.log_level))
+        self._log_listener = attach_queue_listener(root, *handlers)
+        atexit.register(self._stop_logging)
+
+    def _stop_logging(self) -> None:
+        """Write out queued log records and stop the background writer."""
+        listener, self._log_listener = self._log_listener, None
+        if listener is not None:
+            listener.stop()
 
     def _build_graph(self) -> None:
-        """Extract concepts and build knowledge graph."""
-        self.logger.info(f"Extracting concepts from vault: {self.vault_path}")
-
-        # Extract all concepts
-        concepts = self.extractor.extract_all_concepts()
+        """
+        Extract concepts and build knowledge graph.
 
-        if not concepts:
-            self.logger.warning("No concepts found in vault!")
+        Does nothing if no markdown file changed since the last build.
+        """
+        # One walk of the vault serves both the snapshot check and extraction
+        signatures = self.extractor.file_signatures()
+        fingerprint = self.extractor.fingerprint(signatures)
+        if fingerprint == self._vault_fingerprint and self.query_engine is not None:
+            logger.info("Vault unchanged, keeping the current graph")
             return
 
-        # Build graph
-        graph = self.graph_builder.build_graph(concepts)
-
-        # Build indexes
-        self.indexer = GraphIndexer(graph)
+        # Reuse the graph built from an identical vault on an earlier run
+        builder: Optional[KnowledgeGraphBuilder] = None
+        indexer: Optional[GraphIndexer] = None
+        snapshot_file = None
+        if self.settings.graph_cache_enabled:
+            snapshot_file = snapshot_path(self.settings.cache_dir, fingerprint)
+            snapshot = load_snapshot(snapshot_file)
+            if snapshot is not None:
+                logger.info(f"Loaded graph snapshot: {snapshot_file}")
+                builder, indexer = snapshot
+                snapshot_file = None
+
+        if builder is None or indexer is None:
+            logger.info(f"Extracting concepts from vault: {self.vault_path}")
+
+            # Build graph while concepts are extracted
+            builder = KnowledgeGraphBuilder()
+            graph = builder.build_graph_streaming(
+                self.extractor.iter_concepts(signatures)
+            )
+
+            if graph.number_of_nodes() == 0:
+                logger.warning("No concepts found in vault!")
+                return
+
+            # Build indexes from the graph's node payloads
+            indexer = GraphIndexer(
+                graph, relations=builder.relations, workers=os.cpu_count() or 1
+            )
+
+        self.graph_builder = builder
+        self.indexer = indexer
+        graph = self.graph_builder.graph
 
         # Create query engine
-        self.query_engine = GraphQueryEngine(graph, self.indexer)
+        self.query_engine = GraphQueryEngine(
+            graph,
+            self.indexer,
+            csr=self.graph_builder.csr,
+            relations=self.graph_builder.relations,
+        )
 
-        self.logger.info(
+        logger.info(
             f"Graph ready: {graph.number_of_nodes()} concepts, "
             f"{graph.number_of_edges()} relations"
         )
 
-    def _register_tools(self) -> None:
-        """Register MCP tools."""
-        if not self.query_engine:
-            self.logger.error("Cannot register tools: query engine not initialized")
-            return
+        self._vault_fingerprint = fingerprint
+
+        if snapshot_file is not None:
+            save_snapshot(snapshot_file, self.graph_builder, self.indexer)
 
+    def _ensure_graph(self) -> Optional[GraphQueryEngine]:
+        """
+        Build the knowledge graph once, on first use.
+
+        Returns:
+            Query engine, or None if the vault has no concepts
+        """
+        if not self._graph_ready.is_set():
+            with self._graph_lock:
+                if not self._graph_ready.is_set():
+                    self._build_graph()
+                    self._graph_ready.set()
+        return self.query_engine
+
+    def reload_graph(self) -> None:
+        """Rebuild the knowledge graph if the vault has changed."""
+        with self._graph_lock:
+            self._build_graph()
+            self._graph_ready.set()
+
+            # Results computed from an earlier graph are stale
+            if self.mcp_tools is not None:
+                self.mcp_tools.clear_cache()
+
+    def _warm_up(self) -> None:
+        """Build the knowledge graph ahead of the first tool call."""
+        try:
+            self._ensure_graph()
+        except Exception as e:
+            # Tool calls retry the build and report the error themselves
+            logger.error(f"Background graph build failed: {e}")
+
+    def _register_tools(self) -> None:
+        """Register MCP tools (the graph is built when a tool first needs it)."""
         self.mcp_tools = MCPTools(
-            self.query_engine,
+            LazyQueryEngine(self._ensure_graph),  # type: ignore[arg-type]
             self.sanitizer,
             self.audit_logger,
+            manifest_path=self.settings.cache_dir / TOOL_MANIFEST_FILE,
         )
 
         self.mcp_tools.register_tools(self.mcp)
-        self.logger.info("MCP tools registered")
+        logger.info("MCP tools registered")
 
     def run(self) -> None:
         """Run MCP server (STDIO mode)."""
-        self.logger.info("Starting MCP server (STDIO mode)...")
-        self.mcp.run()
+        logger.info("Starting MCP server (STDIO mode)...")
+
+        # Build the graph while the client connects
+        threading.Thread(target=self._warm_up, name="graph-warmup", daemon=True).start()
+
+        # Like self.mcp.run(), but on a uvloop event loop when it is installed
+        backend_options = {"use_uvloop": True} if find_spec("uvloop") else {}
+        try:
+            anyio.run(self._serve, backend_options=backend_options)
+        finally:
+            self._stop_logging()
+
+    async def _serve(self) -> None:
+        """Write the tool manifest, then serve MCP requests."""
+        if self.mcp_tools is not None:
+            await self.mcp_tools.write_manifest(self.mcp)
+        await self.mcp.run_async()
 
     def get_app(self):
         """Get FastMCP app for programmatic use."""
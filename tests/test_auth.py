@@ -0,0 +1,46 @@
+"""Tests for JWT authentication."""
+
+import time
+from pathlib import Path
+from typing import Iterator
+
+import jwt
+import pytest
+
+from obsidian_ontology_mcp.config import get_settings
+from obsidian_ontology_mcp.security.auth import AuthManager
+
+
+@pytest.fixture
+def auth(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[AuthManager]:
+    monkeypatch.setenv("VAULT_PATH", str(tmp_path))
+    monkeypatch.setenv("LOG_FILE", str(tmp_path / "logs" / "server.log"))
+    monkeypatch.setenv("AUDIT_LOG_FILE", str(tmp_path / "logs" / "audit.log"))
+    get_settings.cache_clear()
+    yield AuthManager()
+    get_settings.cache_clear()
+
+
+def test_token_used_before_nbf_is_accepted_once_valid(auth: AuthManager) -> None:
+    security = get_settings().security
+    now = time.time()
+    token = jwt.encode(
+        {"sub": "alice", "nbf": now + 1, "exp": now + 60},
+        security.jwt_secret_key,
+        algorithm=security.jwt_algorithm,
+    )
+
+    assert auth.verify_token(token) is None
+
+    time.sleep(max(0.0, now + 1.1 - time.time()))
+    token_data = auth.verify_token(token)
+
+    assert token_data is not None
+    assert token_data.username == "alice"
+
+
+def test_invalid_token_stays_rejected(auth: AuthManager) -> None:
+    token = auth.create_access_token({"sub": "alice"}) + "x"
+
+    assert auth.verify_token(token) is None
+    assert auth.verify_token(token) is None
@@ -0,0 +1,26 @@
+"""Tests for SKOS concept extraction."""
+
+from pathlib import Path
+
+from obsidian_ontology_mcp.extraction.parser import FrontmatterParser
+from obsidian_ontology_mcp.extraction.skos_extractor import SKOSExtractor
+
+
+def _write_note(vault: Path, name: str, frontmatter: str) -> Path:
+    path = vault / f"{name}.md"
+    path.write_text(f"---\n{frontmatter}---\n\nBody of {name}.\n", encoding="utf-8")
+    return path
+
+
+def test_non_string_relation_value_skips_note(tmp_path: Path) -> None:
+    bad = _write_note(tmp_path, "Bad Note", "prefLabel: Bad Note\nbroader: 42\n")
+    _write_note(
+        tmp_path, "Good Note", "prefLabel: Good Note\nbroader: Parent Concept\n"
+    )
+
+    assert FrontmatterParser().parse_file(bad) is None
+
+    concepts = SKOSExtractor(tmp_path).extract_all_concepts()
+
+    assert [c.concept_id for c in concepts] == ["good_note"]
+    assert concepts[0].broader == ["parent_concept"]